@@ -1,11 +1,32 @@
 import os
 import logging
-import requests
+import shelve
+import threading
+import asyncio
+import time
+import orjson
+import httpx
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
 import pandas as pd
+import numpy as np
 from datetime import datetime, UTC, timedelta
 from dotenv import load_dotenv
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Mapping, Optional, Tuple
+from types import MappingProxyType
+from bisect import bisect_left, bisect_right
+from functools import lru_cache, cached_property
+from itertools import chain
 import math
+import io
+import zipfile
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
+try:
+    from numba import njit
+except ImportError:  # Numba is optional; the scoring kernels then run as plain Python
+    def njit(*args, **kwargs):
+        return lambda func: func
 import openpyxl
 import re
 
@@ -15,10 +36,16 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def _freeze(value: Any) -> Any:
+    """Recursively wrap nested dicts in read-only MappingProxyType views."""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
+
 class IndustryStandards:
     """Industry standards and benchmarks for code quality metrics."""
     
-    COMMIT_STANDARDS = {
+    COMMIT_STANDARDS = _freeze({
         'frequency': {
             'excellent': {'min_weekly': 3, 'max_weekly': 15, 'variance_threshold': 5},
             'good': {'min_weekly': 2, 'max_weekly': 20, 'variance_threshold': 10},
@@ -31,9 +58,9 @@ class IndustryStandards:
             'average': 'Moderate commit frequency with some inconsistency',
             'below_average': 'Irregular commit patterns indicating potential process issues'
         }
-    }
+    })
     
-    CODE_CHURN_STANDARDS = {
+    CODE_CHURN_STANDARDS = _freeze({
         'weekly_churn': {
             'excellent': {'ratio': 200, 'deletion_ratio': 0.8},
             'good': {'ratio': 500, 'deletion_ratio': 1.0},
@@ -46,9 +73,9 @@ class IndustryStandards:
             'average': 'Notable churn but within acceptable limits',
             'below_average': 'High churn indicating potential stability issues'
         }
-    }
+    })
     
-    BRANCH_STANDARDS = {
+    BRANCH_STANDARDS = _freeze({
         'complexity': {
             'excellent': {'max_branches': 5, 'max_age_days': 7},
             'good': {'max_branches': 8, 'max_age_days': 14},
@@ -61,9 +88,9 @@ class IndustryStandards:
             'average': 'Acceptable branch count with some stale branches',
             'below_average': 'Too many branches or long-lived feature branches'
         }
-    }
+    })
     
-    CODE_QUALITY_STANDARDS = {
+    CODE_QUALITY_STANDARDS = _freeze({
         'test_coverage': {
             'excellent': {'min_ratio': 0.8, 'min_coverage': 90},
             'good': {'min_ratio': 0.6, 'min_coverage': 80},
@@ -76,9 +103,9 @@ class IndustryStandards:
             'average': {'doc_ratio': 0.1, 'has_wiki': False, 'has_contributing': False},
             'below_average': {'doc_ratio': 0.05, 'has_wiki': False, 'has_contributing': False}
         }
-    }
+    })
     
-    ABERRANCY_STANDARDS = {
+    ABERRANCY_STANDARDS = _freeze({
         'excellent': {
             'score_range': (0, 20),
             'description': 'Minimal deviation from best practices',
@@ -99,84 +126,141 @@ class IndustryStandards:
             'description': 'Significant deviations from best practices',
             'risk_level': 'High Risk'
         }
-    }
+    })
     
     @staticmethod
-    def get_commit_rating(avg_weekly_commits: float, variance: float) -> Dict[str, Any]:
+    @lru_cache(maxsize=1024)
+    def get_commit_rating(avg_weekly_commits: float, variance: float) -> Mapping[str, Any]:
         """Get rating based on commit patterns."""
-        for rating, criteria in IndustryStandards.COMMIT_STANDARDS['frequency'].items():
-            if (criteria['min_weekly'] <= avg_weekly_commits <= criteria['max_weekly'] and 
-                variance <= criteria['variance_threshold']):
-                return {
-                    'rating': rating,
-                    'description': IndustryStandards.COMMIT_STANDARDS['description'][rating],
-                    'industry_avg': criteria['min_weekly'],
-                    'variance_threshold': criteria['variance_threshold']
-                }
-        return {
-            'rating': 'below_average',
-            'description': IndustryStandards.COMMIT_STANDARDS['description']['below_average'],
-            'industry_avg': IndustryStandards.COMMIT_STANDARDS['frequency']['average']['min_weekly'],
-            'variance_threshold': IndustryStandards.COMMIT_STANDARDS['frequency']['average']['variance_threshold']
-        }
+        return _COMMIT_RATINGS[max(
+            bisect_left(_COMMIT_MAX_WEEKLY, avg_weekly_commits),
+            bisect_left(_COMMIT_NEG_MIN_WEEKLY, -avg_weekly_commits),
+            bisect_left(_COMMIT_VARIANCE, variance)
+        )]
 
     @staticmethod
-    def get_churn_rating(weekly_churn: float, deletion_ratio: float) -> Dict[str, Any]:
+    @lru_cache(maxsize=1024)
+    def get_churn_rating(weekly_churn: float, deletion_ratio: float) -> Mapping[str, Any]:
         """Get rating based on code churn."""
-        for rating, criteria in IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn'].items():
-            if weekly_churn <= criteria['ratio'] and deletion_ratio <= criteria['deletion_ratio']:
-                return {
-                    'rating': rating,
-                    'description': IndustryStandards.CODE_CHURN_STANDARDS['description'][rating],
-                    'industry_threshold': criteria['ratio'],
-                    'deletion_ratio_threshold': criteria['deletion_ratio']
-                }
-        return {
-            'rating': 'below_average',
-            'description': IndustryStandards.CODE_CHURN_STANDARDS['description']['below_average'],
-            'industry_threshold': IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn']['average']['ratio'],
-            'deletion_ratio_threshold': IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn']['average']['deletion_ratio']
-        }
+        return _CHURN_RATINGS[max(
+            bisect_left(_CHURN_RATIO, weekly_churn),
+            bisect_left(_CHURN_DELETION_RATIO, deletion_ratio)
+        )]
 
     @staticmethod
-    def get_branch_rating(branch_count: int, max_branch_age_days: float) -> Dict[str, Any]:
+    @lru_cache(maxsize=1024)
+    def get_branch_rating(branch_count: int, max_branch_age_days: float) -> Mapping[str, Any]:
         """Get rating based on branch complexity."""
-        for rating, criteria in IndustryStandards.BRANCH_STANDARDS['complexity'].items():
-            if branch_count <= criteria['max_branches'] and max_branch_age_days <= criteria['max_age_days']:
-                return {
-                    'rating': rating,
-                    'description': IndustryStandards.BRANCH_STANDARDS['description'][rating],
-                    'industry_max_branches': criteria['max_branches'],
-                    'industry_max_age': criteria['max_age_days']
-                }
-        return {
-            'rating': 'below_average',
-            'description': IndustryStandards.BRANCH_STANDARDS['description']['below_average'],
-            'industry_max_branches': IndustryStandards.BRANCH_STANDARDS['complexity']['average']['max_branches'],
-            'industry_max_age': IndustryStandards.BRANCH_STANDARDS['complexity']['average']['max_age_days']
-        }
+        return _BRANCH_RATINGS[max(
+            bisect_left(_BRANCH_MAX_BRANCHES, branch_count),
+            bisect_left(_BRANCH_MAX_AGE, max_branch_age_days)
+        )]
 
     @staticmethod
-    def get_aberrancy_rating(aberrancy_score: float) -> Dict[str, Any]:
+    @lru_cache(maxsize=1024)
+    def get_aberrancy_rating(aberrancy_score: float) -> Mapping[str, Any]:
         """Get rating based on aberrancy score."""
-        for rating, criteria in IndustryStandards.ABERRANCY_STANDARDS.items():
-            min_score, max_score = criteria['score_range']
-            if min_score <= aberrancy_score < max_score:
-                return {
-                    'rating': rating,
-                    'description': criteria['description'],
-                    'risk_level': criteria['risk_level']
-                }
-        return {
-            'rating': 'below_average',
-            'description': IndustryStandards.ABERRANCY_STANDARDS['below_average']['description'],
-            'risk_level': IndustryStandards.ABERRANCY_STANDARDS['below_average']['risk_level']
-        }
+        if aberrancy_score < _ABERRANCY_LOWER:
+            return _ABERRANCY_RATINGS[-1]
+        return _ABERRANCY_RATINGS[bisect_right(_ABERRANCY_UPPER, aberrancy_score)]
+
+# Precomputed tier tables for the IndustryStandards rating lookups. Each tier
+# is strictly looser than the one before it, so the first matching tier is the
+# largest of the per-criterion bisect positions. Thresholds are inclusive (a
+# value equal to a tier's maximum still earns that tier), hence bisect_left.
+# Every table carries one extra trailing entry for the fallback result, which
+# is where a bisect past the last threshold lands.
+def _tier_ratings(tiers: Mapping[str, Mapping], payload, fallback: Dict[str, Any]) -> tuple:
+    """Build frozen rating results for each tier plus the fallback."""
+    return tuple(
+        MappingProxyType({'rating': rating, **payload(rating, criteria)})
+        for rating, criteria in tiers.items()
+    ) + (MappingProxyType(fallback),)
+
+_COMMIT_TIERS = IndustryStandards.COMMIT_STANDARDS['frequency']
+_COMMIT_DESCRIPTIONS = IndustryStandards.COMMIT_STANDARDS['description']
+_COMMIT_MAX_WEEKLY = [c['max_weekly'] for c in _COMMIT_TIERS.values()]
+_COMMIT_NEG_MIN_WEEKLY = [-c['min_weekly'] for c in _COMMIT_TIERS.values()]
+_COMMIT_VARIANCE = [c['variance_threshold'] for c in _COMMIT_TIERS.values()]
+_COMMIT_RATINGS = _tier_ratings(
+    _COMMIT_TIERS,
+    lambda rating, c: {
+        'description': _COMMIT_DESCRIPTIONS[rating],
+        'industry_avg': c['min_weekly'],
+        'variance_threshold': c['variance_threshold']
+    },
+    {
+        'rating': 'below_average',
+        'description': _COMMIT_DESCRIPTIONS['below_average'],
+        'industry_avg': _COMMIT_TIERS['average']['min_weekly'],
+        'variance_threshold': _COMMIT_TIERS['average']['variance_threshold']
+    }
+)
+
+_CHURN_TIERS = IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn']
+_CHURN_DESCRIPTIONS = IndustryStandards.CODE_CHURN_STANDARDS['description']
+_CHURN_RATIO = [c['ratio'] for c in _CHURN_TIERS.values()]
+_CHURN_DELETION_RATIO = [c['deletion_ratio'] for c in _CHURN_TIERS.values()]
+_CHURN_RATINGS = _tier_ratings(
+    _CHURN_TIERS,
+    lambda rating, c: {
+        'description': _CHURN_DESCRIPTIONS[rating],
+        'industry_threshold': c['ratio'],
+        'deletion_ratio_threshold': c['deletion_ratio']
+    },
+    {
+        'rating': 'below_average',
+        'description': _CHURN_DESCRIPTIONS['below_average'],
+        'industry_threshold': _CHURN_TIERS['average']['ratio'],
+        'deletion_ratio_threshold': _CHURN_TIERS['average']['deletion_ratio']
+    }
+)
+
+_BRANCH_TIERS = IndustryStandards.BRANCH_STANDARDS['complexity']
+_BRANCH_DESCRIPTIONS = IndustryStandards.BRANCH_STANDARDS['description']
+_BRANCH_MAX_BRANCHES = [c['max_branches'] for c in _BRANCH_TIERS.values()]
+_BRANCH_MAX_AGE = [c['max_age_days'] for c in _BRANCH_TIERS.values()]
+_BRANCH_RATINGS = _tier_ratings(
+    _BRANCH_TIERS,
+    lambda rating, c: {
+        'description': _BRANCH_DESCRIPTIONS[rating],
+        'industry_max_branches': c['max_branches'],
+        'industry_max_age': c['max_age_days']
+    },
+    {
+        'rating': 'below_average',
+        'description': _BRANCH_DESCRIPTIONS['below_average'],
+        'industry_max_branches': _BRANCH_TIERS['average']['max_branches'],
+        'industry_max_age': _BRANCH_TIERS['average']['max_age_days']
+    }
+)
+
+# Aberrancy ranges are contiguous half-open intervals, so only the upper
+# bounds are needed once the score is known to be above the lowest bound.
+_ABERRANCY_TIERS = IndustryStandards.ABERRANCY_STANDARDS
+_ABERRANCY_LOWER = _ABERRANCY_TIERS['excellent']['score_range'][0]
+_ABERRANCY_UPPER = [c['score_range'][1] for c in _ABERRANCY_TIERS.values()]
+_ABERRANCY_RATINGS = _tier_ratings(
+    _ABERRANCY_TIERS,
+    lambda rating, c: {
+        'description': c['description'],
+        'risk_level': c['risk_level']
+    },
+    {
+        'rating': 'below_average',
+        'description': _ABERRANCY_TIERS['below_average']['description'],
+        'risk_level': _ABERRANCY_TIERS['below_average']['risk_level']
+    }
+)
+
+# Overall quality rating: a score at or above a threshold earns the next label
+_RATING_THRESHOLDS = [70, 80, 90]
+_RATING_LABELS = np.array(['Below Average', 'Average (Top 50%)', 'Good (Top 25%)', 'Excellent (Top 10%)'], dtype=object)
 
 class MetricDefinitions:
     """Definitions and explanations for all metrics used in the analysis."""
     
-    QUALITY_METRICS = {
+    QUALITY_METRICS = _freeze({
         'quality_score': 'Overall code quality score (0-100) based on various factors including CI/CD, tests, and documentation',
         'total_files': 'Total number of files in the repository',
         'code_files': 'Number of files containing actual source code',
@@ -188,9 +272,9 @@ class MetricDefinitions:
         'has_docs': 'Presence of documentation',
         'has_license': 'Presence of a license file',
         'code_to_test_ratio': 'Ratio of code files to test files (lower is better)'
-    }
+    })
     
-    ABERRANCY_METRICS = {
+    ABERRANCY_METRICS = _freeze({
         'commit_frequency': {
             'title': 'Commit Frequency Analysis',
             'description': 'Measures how often and consistently code is committed',
@@ -218,26 +302,413 @@ class MetricDefinitions:
                 'score': 'Score based on branch management (0-100)'
             }
         }
-    }
+    })
     
-    EFFORT_METRICS = {
+    EFFORT_METRICS = _freeze({
         'total_commits': 'Total number of commits across all contributors',
         'total_changes': 'Total number of lines changed (additions + deletions)',
         'contributors': 'Number of unique contributors',
         'estimated_hours': 'Estimated development hours based on changes',
         'complexity_factor': 'Project complexity multiplier',
         'billable_hours': 'Calculated billable hours (estimated_hours × complexity_factor)'
-    }
+    })
     
-    RATINGS = {
+    RATINGS = _freeze({
         'Excellent': 'Top 10% - Follows best practices with high consistency',
         'Good': 'Top 25% - Generally well-maintained with minor improvements needed',
         'Average': 'Top 50% - Acceptable but has room for improvement',
         'Below Average': 'Bottom 50% - Needs significant improvements'
+    })
+
+# Scoring kernels for calculate_aberrancy_score, JIT-compiled when Numba is
+# installed and plain Python otherwise.
+@njit(cache=True, nogil=True)
+def _commit_frequency_score(avg_commits: float, variance: float) -> float:
+    """Score commit regularity (0-100); higher average and lower variance score better."""
+    return min(100.0, (avg_commits * 10) / (1 + math.sqrt(variance)))
+
+@njit(cache=True, nogil=True)
+def _code_churn_score(weekly_churn: float, churn_threshold: float) -> float:
+    """Score code churn (0-100) relative to the industry threshold."""
+    return max(0.0, 100 - (weekly_churn / churn_threshold) * 100)
+
+@njit(cache=True, nogil=True)
+def _branch_complexity_score(branch_count: float, max_branches: float, max_age: float, max_age_threshold: float) -> float:
+    """Score branch count and age (0-100) relative to the industry maximums."""
+    return max(0.0, 100 - ((branch_count / max_branches * 50) + (max_age / max_age_threshold * 50)))
+
+# Weights of the commit frequency, code churn and branch complexity scores
+# in the overall aberrancy score
+_ABERRANCY_WEIGHTS = np.array([0.4, 0.3, 0.3], dtype=np.float64)
+
+def _series_stats(arr: np.ndarray) -> Tuple[Any, Any, Any, Any]:
+    """Get (mean, variance, sum, absolute sum) of an array along its first axis."""
+    # Derive the mean from the sum and the variance from that mean, rather than
+    # letting mean() and var() each re-reduce the array
+    total = arr.sum(axis=0)
+    mean = total / len(arr)
+    variance = np.square(arr - mean).mean(axis=0)
+    return mean, variance, total, np.abs(arr).sum(axis=0)
+
+# File patterns used to classify repository contents
+_CODE_EXTENSIONS = frozenset({
+    # Web Development
+    '.html', '.htm', '.xhtml', '.css', '.scss', '.sass', '.less', '.styl',
+    '.jsx', '.tsx', '.vue', '.svelte', '.astro', '.liquid', '.pug', '.jade',
+    '.haml', '.ejs', '.hbs', '.handlebars', '.twig',
+    
+    # JavaScript/TypeScript
+    '.js', '.ts', '.mjs', '.cjs', '.coffee', '.ls',
+    '.es', '.es6', '.json', '.jsonc', '.json5',
+    
+    # Python
+    '.py', '.pyi', '.pyx', '.pxd', '.pxi', '.pyc', '.pyd', '.pyw',
+    '.ipynb', '.rpy', '.pyz', '.pyzw',
+    
+    # Java/Kotlin/Scala/Groovy
+    '.java', '.class', '.jar', '.kt', '.kts', '.ktm',
+    '.scala', '.sc', '.groovy', '.gvy', '.gy', '.gsh',
+    
+    # C/C++
+    '.c', '.cpp', '.cc', '.cxx', '.c++', '.h', '.hpp', '.hh', '.hxx',
+    '.h++', '.m', '.mm', '.inc', '.inl', '.ipp',
+    
+    # C#/.NET
+    '.cs', '.csx', '.vb', '.fs', '.fsx', '.fsi', '.fsscript',
+    '.xaml', '.razor', '.cshtml', '.vbhtml', '.aspx', '.ascx',
+    
+    # Ruby
+    '.rb', '.rbw', '.rake', '.gemspec', '.ru', '.erb', '.rhtml',
+    '.rjs', '.rxml', '.builder', '.jbuilder',
+    
+    # PHP
+    '.php', '.php3', '.php4', '.php5', '.php7', '.phtml', '.phps',
+    '.phpt', '.phar',
+    
+    # Go
+    '.go', '.mod', '.sum', '.tmpl', '.gohtml',
+    
+    # Rust
+    '.rs', '.rlib',
+    
+    # Swift/Objective-C
+    '.swift', '.metal',
+    
+    # Shell/Bash
+    '.sh', '.bash', '.command', '.zsh', '.fish', '.ksh', '.csh',
+    '.tcsh', '.rc', '.profile', '.bats',
+    
+    # Dart/Flutter
+    '.dart', '.freezed.dart', '.g.dart',
+    
+    # SQL
+    '.sql', '.mysql', '.pgsql', '.tsql', '.plsql', '.db2',
+    
+    # Configuration/Build
+    '.xml', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
+    '.properties', '.env', '.gradle', '.pom', '.ant',
+    
+    # Mobile Development
+    '.xcodeproj', '.pbxproj', '.storyboard', '.xib',
+    
+    # Systems Programming
+    '.asm', '.s', '.nasm', '.masm', '.gas',
+    
+    # Other Languages
+    '.r', '.rmd',  # R
+    '.pl', '.pm', '.t',  # Perl
+    '.lua',  # Lua
+    '.ex', '.exs',  # Elixir
+    '.erl', '.hrl',  # Erlang
+    '.elm',  # Elm
+    '.clj', '.cljs', '.cljc', '.edn',  # Clojure
+    '.hs', '.lhs',  # Haskell
+    '.ml', '.mli', '.mll', '.mly',  # OCaml
+    '.f', '.f90', '.f95', '.f03', '.f08',  # Fortran
+    '.mat', '.fig',  # MATLAB
+    '.jl',  # Julia
+    '.v', '.vh', '.sv', '.svh',  # Verilog/SystemVerilog
+    '.vhd', '.vhdl',  # VHDL
+    '.tcl', '.tk', '.itk',  # Tcl/Tk
+    '.pro', '.pri',  # Qt/QMake
+    '.cmake', '.cmake.in',  # CMake
+    '.nim', '.nims',  # Nim
+    '.d',  # D
+    '.zig',  # Zig
+    '.cr',  # Crystal
+    
+    # Documentation
+    '.md', '.markdown', '.rst', '.adoc', '.asciidoc', '.tex',
+    '.wiki', '.mediawiki', '.org',
+    
+    # Template Files
+    '.template', '.j2', '.jinja', '.jinja2', '.mustache',
+    
+    # Data Formats
+    '.proto', '.thrift', '.avsc', '.graphql', '.gql',
+    
+    # Infrastructure as Code
+    '.tf', '.tfvars', '.hcl',  # Terraform
+    '.cf', '.cft',  # CloudFormation
+    '.k8s', '.helm',  # Kubernetes
+    
+    # AI/ML
+    '.pkl', '.h5', '.onnx', '.pbtxt', '.pb'
+})
+
+_TEST_PATTERNS = frozenset({'test', 'spec', '_test', '_spec', 'tests', 'specs'})
+_DOC_PATTERNS = frozenset({'docs', 'documentation', 'wiki', 'README', 'CONTRIBUTING'})
+_CI_PATTERNS = frozenset({'.github/workflows', '.travis.yml', 'azure-pipelines.yml', 'Jenkinsfile'})
+
+# Substring matchers equivalent to any(pattern in name for pattern in ...),
+# compiled once so each name is scanned a single time in C.
+_TEST_RE = re.compile('|'.join(map(re.escape, sorted(_TEST_PATTERNS))))
+_DOC_RE = re.compile('|'.join(map(re.escape, sorted(_DOC_PATTERNS))))
+_CI_RE = re.compile('|'.join(map(re.escape, sorted(_CI_PATTERNS))))
+
+# Excel styles shared by every exported cell. Write-only worksheets cannot be
+# formatted after the fact, so cells are styled as they are streamed out.
+_THIN_SIDE = openpyxl.styles.Side(style='thin')
+_THIN_BORDER = openpyxl.styles.Border(left=_THIN_SIDE, right=_THIN_SIDE, top=_THIN_SIDE, bottom=_THIN_SIDE)
+_HEADER_FONT = openpyxl.styles.Font(bold=True)
+_HEADER_FILL = openpyxl.styles.PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid')
+_HEADER_STYLE = 'header'
+_BODY_STYLE = 'bordered'
+_ROW_HEIGHT = 15
+
+@lru_cache(maxsize=1)
+def _build_standards_df() -> pd.DataFrame:
+    """Build the Standards sheet; the source tables are constants, so this runs once per process."""
+    standards_data = []
+    
+    # Add Aberrancy Standards
+    for rating, criteria in IndustryStandards.ABERRANCY_STANDARDS.items():
+        standards_data.append({
+            'Category': 'Aberrancy Score',
+            'Rating': rating.title(),
+            'Criteria': f"Score Range: {criteria['score_range'][0]}-{criteria['score_range'][1]}",
+            'Description': f"{criteria['description']} ({criteria['risk_level']})"
+        })
+    
+    # Commit standards
+    for rating, criteria in IndustryStandards.COMMIT_STANDARDS['frequency'].items():
+        standards_data.append({
+            'Category': 'Commit Frequency',
+            'Rating': rating.title(),
+            'Criteria': f"Weekly: {criteria['min_weekly']}-{criteria['max_weekly']}, Var: {criteria['variance_threshold']}",
+            'Description': IndustryStandards.COMMIT_STANDARDS['description'][rating]
+        })
+    
+    # Code churn standards
+    for rating, criteria in IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn'].items():
+        standards_data.append({
+            'Category': 'Code Churn',
+            'Rating': rating.title(),
+            'Criteria': f"Churn: {criteria['ratio']}, Del ratio: {criteria['deletion_ratio']}",
+            'Description': IndustryStandards.CODE_CHURN_STANDARDS['description'][rating]
+        })
+    
+    # Branch standards
+    for rating, criteria in IndustryStandards.BRANCH_STANDARDS['complexity'].items():
+        standards_data.append({
+            'Category': 'Branch Complexity',
+            'Rating': rating.title(),
+            'Criteria': f"Branches: {criteria['max_branches']}, Age: {criteria['max_age_days']}d",
+            'Description': IndustryStandards.BRANCH_STANDARDS['description'][rating]
+        })
+    
+    return pd.DataFrame(standards_data)
+
+@lru_cache(maxsize=1)
+def _build_definitions_df() -> pd.DataFrame:
+    """Build the Definitions sheet; the source tables are constants, so this runs once per process."""
+    definitions_data = []
+    
+    # Quality Metrics
+    for metric, definition in MetricDefinitions.QUALITY_METRICS.items():
+        definitions_data.append({
+            'Category': 'Code Quality',
+            'Metric': metric,
+            'Definition': definition
+        })
+    
+    # Aberrancy Metrics
+    for category, details in MetricDefinitions.ABERRANCY_METRICS.items():
+        for metric, definition in details['metrics'].items():
+            definitions_data.append({
+                'Category': details['title'],
+                'Metric': metric,
+                'Definition': definition
+            })
+    
+    # Effort Metrics
+    for metric, definition in MetricDefinitions.EFFORT_METRICS.items():
+        definitions_data.append({
+            'Category': 'Effort Analysis',
+            'Metric': metric,
+            'Definition': definition
+        })
+    
+    # Ratings
+    for rating, definition in MetricDefinitions.RATINGS.items():
+        definitions_data.append({
+            'Category': 'Ratings',
+            'Metric': rating,
+            'Definition': definition
+        })
+    
+    return pd.DataFrame(definitions_data)
+
+class RepoAnalysis(Mapping[str, Any]):
+    """Analysis of a single repository whose metric groups are computed on first access.
+    
+    Behaves like the read-only dict previously returned by analyze_repository,
+    so existing ``analysis['quality_metrics']`` style access keeps working.
+    """
+    
+    KEYS = ('repository', 'analyzed_at', 'quality_metrics', 'aberrancy_metrics', 'effort_metrics')
+    
+    def __init__(self, analyzer: 'CodeQualityAnalyzer', repo: str, prefetched: Optional[Dict[str, Any]] = None):
+        self._analyzer = analyzer
+        self.repository = repo
+        self.analyzed_at = datetime.now(UTC).isoformat()
+        # API payloads already fetched (by the async path) so scoring makes no requests
+        self._prefetched = prefetched or {}
+    
+    @cached_property
+    def quality_metrics(self) -> Dict[str, Any]:
+        return self._analyzer.calculate_code_quality_score(self.repository, self._prefetched.get('contents'))
+    
+    @cached_property
+    def aberrancy_metrics(self) -> Dict[str, Any]:
+        return self._analyzer.calculate_aberrancy_score(self.repository, self._prefetched.get('series'))
+    
+    @cached_property
+    def effort_metrics(self) -> Dict[str, Any]:
+        return self._analyzer.calculate_billable_efforts(self.repository, self._prefetched.get('contributors'))
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self):
+        return iter(self.KEYS)
+    
+    def __len__(self) -> int:
+        return len(self.KEYS)
+
+class XlsxDirectWriter:
+    """Writes plain data sheets as raw SpreadsheetML inside an openpyxl-built package.
+    
+    openpyxl still lays out the workbook (sheet list, column widths, styles).
+    Direct sheets are left empty there, and their rows are rendered here with
+    plain string joins and spliced into the package when it is saved, so no
+    per-cell objects are created for them.
+    """
+    
+    _SHEET_DATA = re.compile(rb'<sheetData\s*(?:/>|>\s*</sheetData>)')
+    _MAIN_NS = {'m': 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'}
+    _REL_ID = '{http://schemas.openxmlformats.org/officeDocument/2006/relationships}id'
+
+    def __init__(self, workbook: openpyxl.Workbook):
+        self.workbook = workbook
+        self._sheet_rows: Dict[str, bytes] = {}
+
+    def add_sheet(self, worksheet, rows, width: int, header_style: int, body_style: int):
+        """Render rows for an empty sheet, padded to width; the first row is the header."""
+        self.add_rendered(worksheet, self.render_rows(rows, width, header_style, body_style))
+
+    def add_rendered(self, worksheet, sheet_data: bytes):
+        """Use already rendered <sheetData> XML for an empty sheet."""
+        self._sheet_rows[worksheet.title] = sheet_data
+
+    @classmethod
+    def render_rows(cls, rows, width: int, header_style: int, body_style: int) -> bytes:
+        """Render rows as a <sheetData> element, padded to width; the first row is the header."""
+        columns = [openpyxl.utils.get_column_letter(idx) for idx in range(1, width + 1)]
+        parts = []
+        for row_idx, values in enumerate(rows, start=1):
+            style = header_style if row_idx == 1 else body_style
+            parts.append(f'<row r="{row_idx}">')
+            for column, letter in enumerate(columns):
+                value = values[column] if column < len(values) else None
+                parts.append(cls._cell_xml(f'{letter}{row_idx}', value, style))
+            parts.append('</row>')
+        return f"<sheetData>{''.join(parts)}</sheetData>".encode('utf-8')
+
+    @staticmethod
+    def _cell_xml(ref: str, value: Any, style: int) -> str:
+        """Serialize one cell as a number, an inline string, or a styled blank."""
+        if value is None:
+            return f'<c r="{ref}" s="{style}"/>'
+        if isinstance(value, (int, float, np.number)) and not isinstance(value, (bool, np.bool_)):
+            return f'<c r="{ref}" s="{style}"><v>{value}</v></c>'
+        return f'<c r="{ref}" s="{style}" t="inlineStr"><is><t xml:space="preserve">{escape(str(value))}</t></is></c>'
+
+    def save(self, output_file: str):
+        """Save the workbook, splicing the rendered rows into their sheets."""
+        buffer = io.BytesIO()
+        self.workbook.save(buffer)
+        with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(output_file, 'w', zipfile.ZIP_DEFLATED) as target:
+            titles = self._sheet_titles(source)
+            for item in source.infolist():
+                data = source.read(item.filename)
+                sheet_data = self._sheet_rows.get(titles.get(item.filename))
+                if sheet_data is not None:
+                    data = self._SHEET_DATA.sub(lambda _: sheet_data, data, count=1)
+                target.writestr(item, data)
+
+    def _sheet_titles(self, package: zipfile.ZipFile) -> Dict[str, str]:
+        """Map each worksheet part in the package to its sheet title."""
+        rels = ET.fromstring(package.read('xl/_rels/workbook.xml.rels'))
+        targets = {rel.get('Id'): rel.get('Target') for rel in rels}
+        workbook = ET.fromstring(package.read('xl/workbook.xml'))
+        titles = {}
+        for sheet in workbook.iterfind('m:sheets/m:sheet', self._MAIN_NS):
+            target = targets[sheet.get(self._REL_ID)]
+            path = target.lstrip('/') if target.startswith('/') else f'xl/{target}'
+            titles[path] = sheet.get('name')
+        return titles
+
+@lru_cache(maxsize=8)
+def _render_static_sheet(build_df, header_style: int, body_style: int) -> bytes:
+    """Render a constant sheet's XML once per process and style assignment."""
+    df = build_df()
+    rows = chain([tuple(df.columns)], df.itertuples(index=False, name=None))
+    return XlsxDirectWriter.render_rows(rows, len(df.columns), header_style, body_style)
+
+# Transient GitHub gateway errors are retried with exponential backoff
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_MAX_RETRIES = 3
+_RETRY_BACKOFF = 0.5
+
+# Polling schedule for /stats endpoints that answer 202 while computing
+_STATS_MAX_POLLS = 5
+_STATS_MAX_BACKOFF = 30
+
+# In-flight request cap for the async API layer, to stay clear of GitHub's
+# secondary rate limits
+_ASYNC_CONCURRENCY = 10
+
+# Pause paginated reads until the reset time once fewer requests than this remain
+_RATE_LIMIT_FLOOR = 10
+
+# Branch names with their last commit date, one page of up to 100 refs per request
+_BRANCH_DATES_QUERY = """
+query($owner: String!, $name: String!, $cursor: String) {
+  repository(owner: $owner, name: $name) {
+    refs(refPrefix: "refs/heads/", first: 100, after: $cursor) {
+      nodes { name target { ... on Commit { committedDate } } }
+      pageInfo { endCursor hasNextPage }
     }
+  }
+}
+"""
 
 class CodeQualityAnalyzer:
-    def __init__(self, token: str, org: str):
+    def __init__(self, token: str, org: str, max_workers: int = 16,
+                 use_cache: bool = True, cache_file: str = '.gh_http_cache'):
         self.token = token
         self.org = org
         self.headers = {
@@ -245,33 +716,239 @@ class CodeQualityAnalyzer:
             'Accept': 'application/vnd.github.v3+json'
         }
         self.base_url = 'https://api.github.com'
+        self.max_workers = max_workers
+        
+        # Shared HTTP/2 client: concurrent requests are multiplexed over pooled
+        # TLS connections instead of opening one per call. The transport
+        # retries failed connection attempts; 5xx gateway errors are retried
+        # in _get.
+        self.session = httpx.Client(
+            headers=self.headers,
+            transport=httpx.HTTPTransport(
+                http2=True,
+                retries=3,
+                limits=httpx.Limits(max_connections=max_workers * 2, max_keepalive_connections=max_workers)
+            ),
+            timeout=30,
+            # Renamed and transferred repositories answer 301
+            follow_redirects=True
+        )
+        
+        # Conditional-request cache: URL -> (validator headers, parsed body),
+        # revalidated with If-None-Match / If-Modified-Since. A 304 reply
+        # costs no rate limit and carries no body, so unchanged endpoints are
+        # served from here on re-runs.
+        self._etag_lock = threading.Lock()
+        self._etag_cache = None
+        if use_cache:
+            try:
+                self._etag_cache = shelve.open(cache_file)
+            except Exception as e:
+                logging.warning(f"Could not open response cache {cache_file}, continuing without it: {str(e)}")
+        self._async_limit: Optional[asyncio.Semaphore] = None
         self.industry_standards = IndustryStandards()
         self.metric_definitions = MetricDefinitions()
 
-    def get_repo_contents(self, repo: str, path: str = '') -> List[Dict]:
-        """Recursively get repository contents."""
-        url = f'{self.base_url}/repos/{self.org}/{repo}/contents/{path}'
+    def _get(self, url: str, params: Dict = None, headers: Dict = None) -> httpx.Response:
+        """GET through the shared client, backing off on transient gateway errors.
+        
+        /stats endpoints answer 202 with no data while GitHub computes the
+        statistics, so those are polled with exponential backoff until ready.
+        """
+        retries = polls = 0
+        while True:
+            response = self.session.get(url, params=params, headers=headers)
+            if response.status_code in _RETRY_STATUSES and retries < _MAX_RETRIES:
+                time.sleep(_RETRY_BACKOFF * 2 ** retries)
+                retries += 1
+            elif response.status_code == 202 and polls < _STATS_MAX_POLLS:
+                time.sleep(min(_STATS_MAX_BACKOFF, 2 ** polls))
+                polls += 1
+            elif (wait_time := self._retry_after(response)) is not None and retries < _MAX_RETRIES:
+                time.sleep(wait_time)
+                retries += 1
+            else:
+                return response
+
+    def _get_json(self, url: str, params: Dict = None) -> Any:
+        """GET a GitHub endpoint, revalidating against the conditional-request cache when enabled."""
+        return self._get_page(url, params)[0]
+
+    def _get_page(self, url: str, params: Dict = None) -> Tuple[Any, Optional[str]]:
+        """GET one page of a GitHub endpoint, returning its body and the rel="next" URL."""
+        key, cached = self._cache_lookup(url, params)
+        response = self._get(url, params=params, headers=cached[0] if cached else None)
+        self._wait_for_rate_limit(response)
+        return self._page_result(response, key, cached)
+
+    def _cache_lookup(self, url: str, params: Dict = None) -> Tuple[Optional[str], Optional[tuple]]:
+        """Find the cache key and any cached (validators, body, next URL) entry for a request."""
+        if self._etag_cache is None:
+            return None, None
+        
+        key = f'{url}?{urlencode(params)}' if params else url
+        with self._etag_lock:
+            return key, self._etag_cache.get(key)
+
+    def _page_result(self, response: httpx.Response, key: Optional[str], cached: Optional[tuple]) -> Tuple[Any, Optional[str]]:
+        """Turn a page response into (body, next URL), answering 304s from the cache and storing 200s."""
+        if response.status_code == 304 and cached:
+            return cached[1], cached[2]
+        self._raise_for_status(response)
+        
+        data = self._decode(response)
+        next_url = response.links.get('next', {}).get('url')
+        if key is None:
+            return data, next_url
+        
+        validators = {}
+        if 'ETag' in response.headers:
+            validators['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if response.status_code == 200 and validators:
+            with self._etag_lock:
+                self._etag_cache[key] = (validators, data, next_url)
+        return data, next_url
+
+    def _raise_for_status(self, response: httpx.Response):
+        """Raise on error responses and on statistics that are still being computed."""
+        response.raise_for_status()
+        if response.status_code == 202:
+            raise ValueError(f"GitHub is still computing statistics for {response.url}")
+
+    def _decode(self, response: httpx.Response) -> Any:
+        """Parse a JSON body with orjson, naming the endpoint when it is not valid JSON."""
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSON from {response.url} (HTTP {response.status_code}): {e}") from e
+
+    def _paged_get(self, url: str, params: Dict = None) -> List[Any]:
+        """GET every page of a list endpoint by following the Link rel="next" header."""
+        params = {'per_page': 100, **(params or {})}
+        items, next_url = self._get_page(url, params)
+        while next_url:
+            # The next URL already carries the query string
+            page, next_url = self._get_page(next_url)
+            items.extend(page)
+        return items
+
+    def _retry_after(self, response: httpx.Response) -> Optional[float]:
+        """Seconds to wait before retrying a rate-limited response, or None if it was not rate limited."""
+        if response.status_code not in (403, 429):
+            return None
+        if 'Retry-After' in response.headers:
+            return float(response.headers['Retry-After'])
+        if response.headers.get('X-RateLimit-Remaining') == '0' and 'X-RateLimit-Reset' in response.headers:
+            return max(0, int(response.headers['X-RateLimit-Reset']) - time.time()) + 1
+        return None
+
+    def _check_rate_limit(self, min_remaining: int = 50):
+        """Wait for the core rate limit to reset before starting work that would exhaust it.
+        
+        /rate_limit does not count against the limit, so probing it is free.
+        """
         try:
-            response = requests.get(url, headers=self.headers)
+            response = self.session.get(f'{self.base_url}/rate_limit')
             response.raise_for_status()
-            return response.json()
+            wait_time = self._core_rate_limit_wait(self._decode(response), min_remaining)
+        except Exception as e:
+            logging.warning(f"Could not check GitHub rate limit: {str(e)}")
+            return
+        if wait_time:
+            time.sleep(wait_time)
+
+    def _core_rate_limit_wait(self, payload: Dict, min_remaining: int) -> float:
+        """Seconds until the core limit resets if fewer than min_remaining requests are left, else 0."""
+        core = payload['resources']['core']
+        if core['remaining'] >= min_remaining:
+            return 0
+        
+        wait_time = max(0, core['reset'] - time.time()) + 1
+        logging.warning(f"Rate limit low ({core['remaining']} remaining). Waiting {wait_time:.0f} seconds...")
+        return wait_time
+
+    def _wait_for_rate_limit(self, response: httpx.Response):
+        """Sleep until the rate limit resets when the remaining budget runs low."""
+        if wait_time := self._rate_limit_wait(response):
+            time.sleep(wait_time)
+
+    def _rate_limit_wait(self, response: httpx.Response) -> float:
+        """Seconds to wait for the rate limit to reset, or 0 while enough budget remains."""
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset = response.headers.get('X-RateLimit-Reset')
+        if remaining is None or reset is None or int(remaining) >= _RATE_LIMIT_FLOOR:
+            return 0
+        
+        wait_time = max(0, int(reset) - time.time()) + 1
+        logging.warning(f"Rate limit low ({remaining} remaining). Waiting {wait_time:.0f} seconds...")
+        return wait_time
+
+    def close(self):
+        """Close the HTTP client and flush the ETag cache."""
+        self.session.close()
+        if self._etag_cache is not None:
+            with self._etag_lock:
+                self._etag_cache.close()
+            self._etag_cache = None
+
+    def get_repo_contents(self, repo: str, ref: str = 'HEAD') -> List[Dict]:
+        """Recursively get repository contents.
+        
+        Uses the Git Trees API so the whole tree comes back in one request,
+        normalized to the contents API shape ('file'/'dir' items with name,
+        path and size).
+        """
+        url = f'{self.base_url}/repos/{self.org}/{repo}/git/trees/{ref}'
+        try:
+            return self._tree_contents(repo, ref, self._get_json(url, {'recursive': 1}))
         except Exception as e:
-            logging.error(f"Error fetching contents for {repo}/{path}: {str(e)}")
+            logging.error(f"Error fetching contents for {repo}@{ref}: {str(e)}")
+            return []
+
+    def _tree_contents(self, repo: str, ref: str, tree: Any) -> List[Dict]:
+        """Normalize a recursive Git Trees response to contents API items."""
+        if not isinstance(tree, dict):
+            logging.error(f"Invalid tree response for {repo}@{ref}")
             return []
+        
+        if tree.get('truncated'):
+            logging.warning(f"Tree listing for {repo}@{ref} was truncated by GitHub")
+        
+        contents = []
+        for entry in tree.get('tree', []):
+            entry_type = entry.get('type')
+            if entry_type == 'blob':
+                item_type = 'file'
+            elif entry_type == 'tree':
+                item_type = 'dir'
+            else:  # Submodules have no content to classify
+                continue
+            
+            path = entry['path']
+            contents.append({
+                'type': item_type,
+                'name': path.rpartition('/')[2],
+                'path': path,
+                'size': entry.get('size', 0)
+            })
+        return contents
 
     def get_commit_activity(self, repo: str) -> List[Dict]:
         """Get commit activity for the past year."""
         url = f'{self.base_url}/repos/{self.org}/{repo}/stats/commit_activity'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url)
         except Exception as e:
             logging.error(f"Error fetching commit activity for {repo}: {str(e)}")
             return []
 
-    def calculate_code_quality_score(self, repo: str) -> Dict[str, Any]:
-        """Calculate code quality score based on various metrics."""
+    def calculate_code_quality_score(self, repo: str, contents: Optional[List[Dict]] = None) -> Dict[str, Any]:
+        """Calculate code quality score based on various metrics.
+        
+        contents may be passed in when already fetched; otherwise it is requested.
+        """
         quality_metrics = {
             'total_files': 0,
             'code_files': 0,
@@ -288,132 +965,24 @@ class CodeQualityAnalyzer:
         }
 
         # Check for important files and directories
-        contents = self.get_repo_contents(repo)
-        
-        # File patterns to check
-        code_extensions = {
-            # Web Development
-            '.html', '.htm', '.xhtml', '.css', '.scss', '.sass', '.less', '.styl',
-            '.jsx', '.tsx', '.vue', '.svelte', '.astro', '.liquid', '.pug', '.jade',
-            '.haml', '.ejs', '.hbs', '.handlebars', '.twig',
-            
-            # JavaScript/TypeScript
-            '.js', '.ts', '.mjs', '.cjs', '.jsx', '.tsx', '.coffee', '.ls',
-            '.es', '.es6', '.json', '.jsonc', '.json5',
-            
-            # Python
-            '.py', '.pyi', '.pyx', '.pxd', '.pxi', '.pyc', '.pyd', '.pyw',
-            '.ipynb', '.rpy', '.pyz', '.pyzw',
-            
-            # Java/Kotlin/Scala/Groovy
-            '.java', '.class', '.jar', '.kt', '.kts', '.ktm',
-            '.scala', '.sc', '.groovy', '.gvy', '.gy', '.gsh',
-            
-            # C/C++
-            '.c', '.cpp', '.cc', '.cxx', '.c++', '.h', '.hpp', '.hh', '.hxx',
-            '.h++', '.m', '.mm', '.inc', '.inl', '.ipp',
-            
-            # C#/.NET
-            '.cs', '.csx', '.vb', '.fs', '.fsx', '.fsi', '.fsscript',
-            '.xaml', '.razor', '.cshtml', '.vbhtml', '.aspx', '.ascx',
-            
-            # Ruby
-            '.rb', '.rbw', '.rake', '.gemspec', '.ru', '.erb', '.rhtml',
-            '.rjs', '.rxml', '.builder', '.jbuilder',
-            
-            # PHP
-            '.php', '.php3', '.php4', '.php5', '.php7', '.phtml', '.phps',
-            '.phpt', '.phar', '.inc',
-            
-            # Go
-            '.go', '.mod', '.sum', '.tmpl', '.gohtml',
-            
-            # Rust
-            '.rs', '.rlib', '.rst',
-            
-            # Swift/Objective-C
-            '.swift', '.m', '.mm', '.h', '.metal',
-            
-            # Shell/Bash
-            '.sh', '.bash', '.command', '.zsh', '.fish', '.ksh', '.csh',
-            '.tcsh', '.rc', '.profile', '.bats',
-            
-            # Dart/Flutter
-            '.dart', '.freezed.dart', '.g.dart',
-            
-            # SQL
-            '.sql', '.mysql', '.pgsql', '.tsql', '.plsql', '.db2',
-            
-            # Configuration/Build
-            '.xml', '.yaml', '.yml', '.toml', '.ini', '.cfg', '.conf',
-            '.properties', '.env', '.gradle', '.pom', '.ant',
-            
-            # Mobile Development
-            '.swift', '.kt', '.java', '.m', '.h', '.mm', '.dart',
-            '.xcodeproj', '.pbxproj', '.storyboard', '.xib',
-            
-            # Systems Programming
-            '.asm', '.s', '.nasm', '.masm', '.gas',
-            
-            # Other Languages
-            '.r', '.rmd',  # R
-            '.pl', '.pm', '.t',  # Perl
-            '.lua',  # Lua
-            '.ex', '.exs',  # Elixir
-            '.erl', '.hrl',  # Erlang
-            '.elm',  # Elm
-            '.clj', '.cljs', '.cljc', '.edn',  # Clojure
-            '.hs', '.lhs',  # Haskell
-            '.ml', '.mli', '.mll', '.mly',  # OCaml
-            '.f', '.f90', '.f95', '.f03', '.f08',  # Fortran
-            '.mat', '.fig', '.m',  # MATLAB
-            '.jl',  # Julia
-            '.v', '.vh', '.sv', '.svh',  # Verilog/SystemVerilog
-            '.vhd', '.vhdl',  # VHDL
-            '.tcl', '.tk', '.itk',  # Tcl/Tk
-            '.pro', '.pri',  # Qt/QMake
-            '.cmake', '.cmake.in',  # CMake
-            '.nim', '.nims',  # Nim
-            '.d',  # D
-            '.zig',  # Zig
-            '.cr',  # Crystal
-            '.rs',  # Rust
-            
-            # Documentation
-            '.md', '.markdown', '.rst', '.adoc', '.asciidoc', '.tex',
-            '.wiki', '.mediawiki', '.org',
-            
-            # Template Files
-            '.tmpl', '.template', '.j2', '.jinja', '.jinja2',
-            '.mustache', '.handlebars', '.hbs', '.ejs',
-            
-            # Data Formats
-            '.proto', '.thrift', '.avsc', '.graphql', '.gql',
-            
-            # Infrastructure as Code
-            '.tf', '.tfvars', '.hcl',  # Terraform
-            '.cf', '.cft',  # CloudFormation
-            '.k8s', '.helm',  # Kubernetes
-            
-            # AI/ML
-            '.ipynb', '.pkl', '.h5', '.onnx', '.pbtxt', '.pb'
-        }
-        test_patterns = {'test', 'spec', '_test', '_spec', 'tests', 'specs'}
-        doc_patterns = {'docs', 'documentation', 'wiki', 'README', 'CONTRIBUTING'}
-        ci_patterns = {'.github/workflows', '.travis.yml', 'azure-pipelines.yml', 'Jenkinsfile'}
+        if contents is None:
+            contents = self.get_repo_contents(repo)
         
         for item in contents:
-            if item['type'] == 'file':
+            item_type = item['type']
+            if item_type == 'file':
                 quality_metrics['total_files'] += 1
                 name = item['name'].lower()
-                ext = os.path.splitext(name)[1]
+                # Same result as os.path.splitext (leading dots are not an extension)
+                stem, dot, suffix = name.rpartition('.')
+                ext = dot + suffix if stem.strip('.') else ''
                 
                 # Check file types
-                if ext in code_extensions:
+                if ext in _CODE_EXTENSIONS:
                     quality_metrics['code_files'] += 1
-                if any(pattern in name for pattern in test_patterns):
+                if _TEST_RE.search(name):
                     quality_metrics['test_files'] += 1
-                if any(pattern in name for pattern in doc_patterns):
+                if _DOC_RE.search(name):
                     quality_metrics['doc_files'] += 1
                 if item['size'] > 1000000:  # Files larger than 1MB
                     quality_metrics['large_files'] += 1
@@ -422,12 +991,12 @@ class CodeQualityAnalyzer:
                 if name == 'license' or name == 'license.md':
                     quality_metrics['has_license'] = True
                 
-            elif item['type'] == 'dir':
-                if any(pattern in item['path'] for pattern in ci_patterns):
+            elif item_type == 'dir':
+                if _CI_RE.search(item['path']):
                     quality_metrics['has_ci'] = True
-                if any(pattern in item['path'].lower() for pattern in test_patterns):
+                if _TEST_RE.search(item['path'].lower()):
                     quality_metrics['has_tests'] = True
-                if any(pattern in item['path'].lower() for pattern in doc_patterns):
+                if _DOC_RE.search(item['path'].lower()):
                     quality_metrics['has_docs'] = True
 
         # Calculate code to test ratio
@@ -447,8 +1016,12 @@ class CodeQualityAnalyzer:
         
         return quality_metrics
 
-    def calculate_aberrancy_score(self, repo: str) -> Dict[str, Any]:
-        """Calculate aberrancy score based on deviations from best practices."""
+    def calculate_aberrancy_score(self, repo: str, series: Optional[Tuple[List, List, Dict]] = None) -> Dict[str, Any]:
+        """Calculate aberrancy score based on deviations from best practices.
+        
+        series is (commit activity, code frequency, branch dates) when already
+        fetched; otherwise the three are requested concurrently.
+        """
         aberrancy_metrics = {
             'commit_frequency_score': 0,
             'code_churn_score': 0,
@@ -477,11 +1050,23 @@ class CodeQualityAnalyzer:
             }
         }
 
+        # Fetch the three independent series up front so their requests overlap
+        if series is None:
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                commit_future = executor.submit(self.get_commit_activity, repo)
+                churn_future = executor.submit(self.get_code_frequency_stats, repo)
+                branches_future = executor.submit(self.get_branches_with_last_commit, repo)
+            series = (commit_future.result(), churn_future.result(), branches_future.result())
+        commit_activity, churn_stats, branch_dates = series
+
         # Calculate commit frequency metrics
-        if commit_activity := self.get_commit_activity(repo):
-            weekly_commits = [week['total'] for week in commit_activity]
-            avg_commits = sum(weekly_commits) / len(weekly_commits)
-            commit_variance = sum((x - avg_commits) ** 2 for x in weekly_commits) / len(weekly_commits)
+        if commit_activity:
+            weekly_commits = np.fromiter(
+                (week['total'] for week in commit_activity),
+                dtype=np.int32,
+                count=len(commit_activity)
+            )
+            avg_commits, commit_variance, _, _ = map(float, _series_stats(weekly_commits))
             
             # Get industry comparison
             commit_rating = IndustryStandards.get_commit_rating(avg_commits, commit_variance)
@@ -498,10 +1083,14 @@ class CodeQualityAnalyzer:
             }
             
             # Calculate score based on industry standards
-            commit_freq_score = min(100, (avg_commits * 10) / (1 + math.sqrt(commit_variance)))
+            commit_freq_score = _commit_frequency_score(avg_commits, commit_variance)
             aberrancy_metrics['commit_frequency_score'] = commit_freq_score
             
             assessment['score'] = commit_freq_score
+            assessment['raw'] = {
+                'variance': commit_variance,
+                'variance_threshold': commit_rating['variance_threshold']
+            }
             assessment['details'] = (
                 f"Average commits per week: {avg_commits:.1f} "
                 f"(Industry: {commit_rating['industry_avg']:.1f}), "
@@ -511,10 +1100,13 @@ class CodeQualityAnalyzer:
 
         # Calculate code churn metrics
         try:
-            if churn_data := self.get_code_frequency_stats(repo):
-                total_additions = sum(week[1] for week in churn_data)
-                total_deletions = sum(abs(week[2]) for week in churn_data)
-                weeks = len(churn_data)
+            if churn_data := churn_stats:
+                # Columns are [week, additions, deletions]; deletions are negative
+                churn = np.asarray(churn_data, dtype=np.int64)
+                _, _, churn_sums, churn_abs_sums = _series_stats(churn[:, 1:])
+                total_additions = int(churn_sums[0])
+                total_deletions = int(churn_abs_sums[1])
+                weeks = len(churn)
                 weekly_churn = (total_additions + total_deletions) / weeks
                 deletion_ratio = total_deletions / max(1, total_additions)
                 
@@ -533,10 +1125,14 @@ class CodeQualityAnalyzer:
                 }
                 
                 # Calculate score based on industry standards
-                churn_score = max(0, 100 - (weekly_churn / churn_rating['industry_threshold']) * 100)
+                churn_score = _code_churn_score(weekly_churn, churn_rating['industry_threshold'])
                 aberrancy_metrics['code_churn_score'] = churn_score
                 
                 assessment['score'] = churn_score
+                assessment['raw'] = {
+                    'deletion_ratio': deletion_ratio,
+                    'deletion_ratio_threshold': churn_rating['deletion_ratio_threshold']
+                }
                 assessment['details'] = (
                     f"Weekly churn: {weekly_churn:.1f} lines "
                     f"(Industry max: {churn_rating['industry_threshold']:.1f}), "
@@ -548,30 +1144,18 @@ class CodeQualityAnalyzer:
 
         # Calculate branch complexity metrics
         try:
-            branches = self.get_branches(repo)
-            if branches:
-                branch_count = len(branches)
+            if branch_dates:
+                branch_count = len(branch_dates)
                 
-                # Calculate branch age
+                # Calculate branch age from each branch's last commit
                 now = datetime.now(UTC)
-                branch_ages = []
-                for branch in branches:
-                    try:
-                        commit_info = self.get_branch_last_commit(repo, branch['name'])
-                        if commit_info and commit_info['commit'] and commit_info['commit']['committer']:
-                            commit_date = commit_info['commit']['committer'].get('date')
-                            if commit_date:
-                                last_commit_date = datetime.strptime(
-                                    commit_date,
-                                    '%Y-%m-%dT%H:%M:%SZ'
-                                ).replace(tzinfo=UTC)
-                                age_days = (now - last_commit_date).days
-                                branch_ages.append(age_days)
-                    except Exception as e:
-                        logging.warning(f"Error processing branch {branch['name']} in {repo}: {str(e)}")
-                        continue
+                branch_ages = np.fromiter(
+                    (age for branch, commit_date in branch_dates.items()
+                     if (age := self._branch_age_days(repo, branch, commit_date, now)) is not None),
+                    dtype=np.int32
+                )
                 
-                max_branch_age = max(branch_ages) if branch_ages else 0
+                max_branch_age = int(branch_ages.max()) if branch_ages.size else 0
                 
                 # Get industry comparison
                 branch_rating = IndustryStandards.get_branch_rating(branch_count, max_branch_age)
@@ -588,13 +1172,17 @@ class CodeQualityAnalyzer:
                 }
                 
                 # Calculate score based on industry standards
-                branch_score = max(0, 100 - (
-                    (branch_count / branch_rating['industry_max_branches'] * 50) +
-                    (max_branch_age / branch_rating['industry_max_age'] * 50)
-                ))
+                branch_score = _branch_complexity_score(
+                    branch_count, branch_rating['industry_max_branches'],
+                    max_branch_age, branch_rating['industry_max_age']
+                )
                 aberrancy_metrics['branch_complexity_score'] = branch_score
                 
                 assessment['score'] = branch_score
+                assessment['raw'] = {
+                    'max_age_days': max_branch_age,
+                    'max_age_threshold': branch_rating['industry_max_age']
+                }
                 assessment['details'] = (
                     f"Active branches: {branch_count} "
                     f"(Industry max: {branch_rating['industry_max_branches']}), "
@@ -633,11 +1221,13 @@ class CodeQualityAnalyzer:
             aberrancy_metrics['branch_complexity_score'] = 0
 
         # Calculate overall aberrancy score
-        aberrancy_metrics['overall_aberrancy_score'] = 100 - (
-            aberrancy_metrics['commit_frequency_score'] * 0.4 +
-            aberrancy_metrics['code_churn_score'] * 0.3 +
-            aberrancy_metrics['branch_complexity_score'] * 0.3
-        )
+        scores = np.array([
+            aberrancy_metrics['commit_frequency_score'],
+            aberrancy_metrics['code_churn_score'],
+            aberrancy_metrics['branch_complexity_score']
+        ], dtype=np.float64)
+        np.clip(scores, 0, 100, out=scores)
+        aberrancy_metrics['overall_aberrancy_score'] = float(100 - scores @ _ABERRANCY_WEIGHTS)
 
         # Get aberrancy rating and risk factors
         aberrancy_rating = IndustryStandards.get_aberrancy_rating(aberrancy_metrics['overall_aberrancy_score'])
@@ -657,28 +1247,36 @@ class CodeQualityAnalyzer:
         if aberrancy_metrics['branch_complexity_score'] < 40:
             risk_factors.append("Complex branching strategy with potential integration challenges")
             
-        # Add specific risk factors based on assessment details
-        for category, details in aberrancy_metrics['assessment_details'].items():
-            comp = details.get('industry_comparison', {})
-            if category == 'commit_frequency':
-                if comp.get('your_variance') and float(comp['your_variance'].replace('N/A', '0')) > float(comp.get('industry_variance_threshold', '10')):
-                    risk_factors.append("High variance in commit frequency")
-            elif category == 'code_churn':
-                if comp.get('your_deletion_ratio') and float(comp['your_deletion_ratio'].replace('N/A', '0')) > float(comp.get('industry_deletion_ratio', '1.0')):
-                    risk_factors.append("High code deletion ratio")
-            elif category == 'branch_patterns':
-                if comp.get('your_max_age') and 'days' in comp['your_max_age']:
-                    days = float(comp['your_max_age'].split()[0])
-                    if days > float(comp.get('industry_max_age', '30').split()[0]):
-                        risk_factors.append("Long-lived branches detected")
+        # Add specific risk factors from the raw values kept alongside each assessment
+        details = aberrancy_metrics['assessment_details']
+        if (raw := details['commit_frequency'].get('raw')) and raw['variance'] > raw['variance_threshold']:
+            risk_factors.append("High variance in commit frequency")
+        if (raw := details['code_churn'].get('raw')) and raw['deletion_ratio'] > raw['deletion_ratio_threshold']:
+            risk_factors.append("High code deletion ratio")
+        if (raw := details['branch_patterns'].get('raw')) and raw['max_age_days'] > raw['max_age_threshold']:
+            risk_factors.append("Long-lived branches detected")
 
         aberrancy_metrics['risk_factors'] = risk_factors
-        aberrancy_metrics['aberrancy_rating'] = aberrancy_rating
+        # Plain copy: the cached rating tables are frozen and shared
+        aberrancy_metrics['aberrancy_rating'] = dict(aberrancy_rating)
 
         return aberrancy_metrics
 
-    def calculate_billable_efforts(self, repo: str) -> Dict[str, Any]:
-        """Calculate billable coding efforts based on commits and changes."""
+    def _branch_age_days(self, repo: str, branch: str, commit_date: Optional[str], now: datetime) -> Optional[int]:
+        """Get the age in days of a branch's last commit, or None if unavailable."""
+        try:
+            if commit_date:
+                last_commit_date = datetime.fromisoformat(commit_date.replace('Z', '+00:00'))
+                return (now - last_commit_date).days
+        except Exception as e:
+            logging.warning(f"Error processing branch {branch} in {repo}: {str(e)}")
+        return None
+
+    def calculate_billable_efforts(self, repo: str, stats: Any = None) -> Dict[str, Any]:
+        """Calculate billable coding efforts based on commits and changes.
+        
+        stats is the /stats/contributors payload when already fetched.
+        """
         effort_metrics = {
             'total_commits': 0,
             'total_changes': 0,
@@ -689,30 +1287,27 @@ class CodeQualityAnalyzer:
         }
 
         try:
-            url = f'{self.base_url}/repos/{self.org}/{repo}/stats/contributors'
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            stats = response.json()
+            if stats is None:
+                url = f'{self.base_url}/repos/{self.org}/{repo}/stats/contributors'
+                stats = self._get_json(url)
 
             if not isinstance(stats, list):
                 logging.error(f"Invalid contributor stats format for {repo}")
                 return effort_metrics
 
-            for contributor in stats:
-                if not isinstance(contributor, dict):
-                    continue
-                    
-                effort_metrics['contributors'] += 1
-                effort_metrics['total_commits'] += contributor.get('total', 0)
-                
-                # Calculate total changes
-                weeks = contributor.get('weeks', [])
-                if isinstance(weeks, list):
-                    for week in weeks:
-                        if isinstance(week, dict):
-                            effort_metrics['total_changes'] += (
-                                week.get('additions', 0) + week.get('deletions', 0)
-                            )
+            # Filter malformed entries once up front, then reduce in bulk
+            contributors = [c for c in stats if isinstance(c, dict)]
+            week_lists = [c.get('weeks', []) for c in contributors]
+            weeks = [w for ws in week_lists if isinstance(ws, list) for w in ws if isinstance(w, dict)]
+            changes = np.fromiter(
+                (w.get('additions', 0) + w.get('deletions', 0) for w in weeks),
+                dtype=np.int64,
+                count=len(weeks)
+            )
+            
+            effort_metrics['contributors'] = len(contributors)
+            effort_metrics['total_commits'] = sum(c.get('total', 0) for c in contributors)
+            effort_metrics['total_changes'] = int(changes.sum())
 
             # Estimate hours based on changes and complexity
             effort_metrics['estimated_hours'] = effort_metrics['total_changes'] / 100  # Assume 100 changes per hour
@@ -723,161 +1318,277 @@ class CodeQualityAnalyzer:
 
         return effort_metrics
 
-    def analyze_repository(self, repo: str) -> Dict[str, Any]:
-        """Analyze a repository for all metrics."""
-        logging.info(f"Analyzing repository: {repo}")
-        
-        analysis = {
-            'repository': repo,
-            'analyzed_at': datetime.now(UTC).isoformat(),
-            'quality_metrics': self.calculate_code_quality_score(repo),
-            'aberrancy_metrics': self.calculate_aberrancy_score(repo),
-            'effort_metrics': self.calculate_billable_efforts(repo)
-        }
+    def analyze_repository(self, repo: str) -> 'RepoAnalysis':
+        """Analyze a repository for all metrics.
         
-        return analysis
+        Metric groups are computed lazily, the first time each one is read.
+        """
+        logging.info(f"Analyzing repository: {repo}")
+        self._check_rate_limit()
+        return RepoAnalysis(self, repo)
 
-    def export_to_excel(self, analyses: List[Dict], output_file: str):
-        """Export analyses to Excel with multiple sheets."""
-        with pd.ExcelWriter(output_file, engine='openpyxl') as writer:
-            self._export_summary(analyses, writer)
-            self._export_industry_standards(writer)
-            self._export_metric_definitions(writer)
-            self._export_detailed_metrics(analyses, writer)
-            self._format_excel_sheets(writer)
-
-    def _export_summary(self, analyses: List[Dict], writer: pd.ExcelWriter):
-        """Export summary data to Excel."""
-        summary_data = []
-        for analysis in analyses:
-            aberrancy_score = analysis['aberrancy_metrics']['overall_aberrancy_score']
-            aberrancy_rating = analysis['aberrancy_metrics'].get('aberrancy_rating', {})
-            
-            summary_data.append({
-                'Repository': analysis['repository'],
-                'Quality Score': round(analysis['quality_metrics']['quality_score'], 2),
-                'Aberrancy Score': round(aberrancy_score, 2),
-                'Industry Rating': self._get_overall_rating(analysis),
-                'Risk Level': aberrancy_rating.get('risk_level', 'N/A'),
-                'Risk Factors': '\n'.join(analysis['aberrancy_metrics']['risk_factors']),
-                'Analyzed At': analysis['analyzed_at']
-            })
-        
-        df = pd.DataFrame(summary_data)
-        df.to_excel(writer, sheet_name='Summary', index=False)
-        
-        # Format the Summary sheet
-        worksheet = writer.sheets['Summary']
-        worksheet.column_dimensions['A'].width = 30
-        worksheet.column_dimensions['B'].width = 15
-        worksheet.column_dimensions['C'].width = 15
-        worksheet.column_dimensions['D'].width = 20
-        worksheet.column_dimensions['E'].width = 15
-        worksheet.column_dimensions['F'].width = 40
-        worksheet.column_dimensions['G'].width = 25
-
-        # Adjust row height for risk factors
-        for idx, row in enumerate(worksheet.iter_rows(min_row=2), start=2):
-            if '\n' in str(row[5].value):  # Risk Factors column
-                worksheet.row_dimensions[idx].height = 15 * (str(row[5].value).count('\n') + 1)
-
-    def _export_industry_standards(self, writer: pd.ExcelWriter):
-        """Export industry standards to Excel."""
-        standards_data = []
-        
-        # Add Aberrancy Standards
-        for rating, criteria in IndustryStandards.ABERRANCY_STANDARDS.items():
-            standards_data.append({
-                'Category': 'Aberrancy Score',
-                'Rating': rating.title(),
-                'Criteria': f"Score Range: {criteria['score_range'][0]}-{criteria['score_range'][1]}",
-                'Description': f"{criteria['description']} ({criteria['risk_level']})"
-            })
-        
-        # Commit standards
-        for rating, criteria in IndustryStandards.COMMIT_STANDARDS['frequency'].items():
-            standards_data.append({
-                'Category': 'Commit Frequency',
-                'Rating': rating.title(),
-                'Criteria': f"Weekly: {criteria['min_weekly']}-{criteria['max_weekly']}, Var: {criteria['variance_threshold']}",
-                'Description': IndustryStandards.COMMIT_STANDARDS['description'][rating]
-            })
-        
-        # Code churn standards
-        for rating, criteria in IndustryStandards.CODE_CHURN_STANDARDS['weekly_churn'].items():
-            standards_data.append({
-                'Category': 'Code Churn',
-                'Rating': rating.title(),
-                'Criteria': f"Churn: {criteria['ratio']}, Del ratio: {criteria['deletion_ratio']}",
-                'Description': IndustryStandards.CODE_CHURN_STANDARDS['description'][rating]
-            })
+    def analyze_repositories(self, repos: List[str], max_workers: int = 16,
+                             metrics: Tuple[str, ...] = ('quality_metrics', 'aberrancy_metrics')) -> List['RepoAnalysis']:
+        """Analyze several repositories concurrently, preserving input order.
         
-        # Branch standards
-        for rating, criteria in IndustryStandards.BRANCH_STANDARDS['complexity'].items():
-            standards_data.append({
-                'Category': 'Branch Complexity',
-                'Rating': rating.title(),
-                'Criteria': f"Branches: {criteria['max_branches']}, Age: {criteria['max_age_days']}d",
-                'Description': IndustryStandards.BRANCH_STANDARDS['description'][rating]
-            })
+        Only the listed metric groups are computed up front on the worker
+        threads (by default the ones the Excel export reads); the rest stay
+        lazy until accessed.
+        """
+        def analyze(repo: str) -> RepoAnalysis:
+            analysis = self.analyze_repository(repo)
+            for metric in metrics:
+                analysis[metric]
+            return analysis
         
-        df = pd.DataFrame(standards_data)
-        df.to_excel(writer, sheet_name='Standards', index=False)
+        if not repos:
+            return []
         
-        # Format the Standards sheet
-        worksheet = writer.sheets['Standards']
-        worksheet.column_dimensions['A'].width = 20
-        worksheet.column_dimensions['B'].width = 15
-        worksheet.column_dimensions['C'].width = 30
-        worksheet.column_dimensions['D'].width = 50
-
-    def _export_metric_definitions(self, writer: pd.ExcelWriter):
-        """Export metric definitions to Excel."""
-        definitions_data = []
+        # Never start more threads than there are repositories to analyze
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(repos))) as executor:
+            return list(executor.map(analyze, repos))
+
+    async def analyze_repositories_async(self, repos: List[str]) -> List['RepoAnalysis']:
+        """Analyze several repositories on one event loop, preserving input order.
         
-        # Quality Metrics
-        for metric, definition in MetricDefinitions.QUALITY_METRICS.items():
-            definitions_data.append({
-                'Category': 'Code Quality',
-                'Metric': metric,
-                'Definition': definition
-            })
+        Every API payload is fetched up front over a shared async HTTP/2
+        client, with at most _ASYNC_CONCURRENCY requests in flight; scoring
+        then runs without further requests.
+        """
+        self._async_limit = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            retries=3,
+            limits=httpx.Limits(max_connections=_ASYNC_CONCURRENCY)
+        )
+        async with httpx.AsyncClient(headers=self.headers, transport=transport, timeout=30,
+                                     follow_redirects=True) as client:
+            await self._check_rate_limit_async(client)
+            return list(await asyncio.gather(*(self.analyze_repository_async(client, repo) for repo in repos)))
+
+    async def _check_rate_limit_async(self, client: httpx.AsyncClient, min_remaining: int = 50):
+        """Async counterpart of _check_rate_limit."""
+        try:
+            response = await client.get(f'{self.base_url}/rate_limit')
+            response.raise_for_status()
+            wait_time = self._core_rate_limit_wait(self._decode(response), min_remaining)
+        except Exception as e:
+            logging.warning(f"Could not check GitHub rate limit: {str(e)}")
+            return
+        if wait_time:
+            await asyncio.sleep(wait_time)
+
+    async def analyze_repository_async(self, client: httpx.AsyncClient, repo: str) -> 'RepoAnalysis':
+        """Async counterpart of analyze_repository that fetches the exported data concurrently.
         
-        # Aberrancy Metrics
-        for category, details in MetricDefinitions.ABERRANCY_METRICS.items():
-            for metric, definition in details['metrics'].items():
-                definitions_data.append({
-                    'Category': details['title'],
-                    'Metric': metric,
-                    'Definition': definition
-                })
+        Contributor statistics are left to the lazy effort_metrics group, as in the
+        threaded path, since the export does not read them.
+        """
+        logging.info(f"Analyzing repository: {repo}")
+        repo_url = f'{self.base_url}/repos/{self.org}/{repo}'
+        contents, commit_activity, churn_stats, branch_dates = await asyncio.gather(
+            self._get_repo_contents_async(client, repo),
+            self._fetch_json_async(client, f'{repo_url}/stats/commit_activity', f"commit activity for {repo}", []),
+            self._fetch_json_async(client, f'{repo_url}/stats/code_frequency', f"code frequency stats for {repo}", []),
+            self._get_branch_dates_async(client, repo)
+        )
+        return RepoAnalysis(self, repo, {
+            'contents': contents,
+            'series': (commit_activity, churn_stats, branch_dates)
+        })
+
+    async def _get_async(self, client: httpx.AsyncClient, url: str, params: Dict = None,
+                         headers: Dict = None) -> httpx.Response:
+        """Async counterpart of _get: bounded concurrency, gateway retries and /stats polling."""
+        retries = polls = 0
+        while True:
+            async with self._request_slot():
+                response = await client.get(url, params=params, headers=headers)
+            if response.status_code in _RETRY_STATUSES and retries < _MAX_RETRIES:
+                await asyncio.sleep(_RETRY_BACKOFF * 2 ** retries)
+                retries += 1
+            elif response.status_code == 202 and polls < _STATS_MAX_POLLS:
+                await asyncio.sleep(min(_STATS_MAX_BACKOFF, 2 ** polls))
+                polls += 1
+            elif (wait_time := self._retry_after(response)) is not None and retries < _MAX_RETRIES:
+                await asyncio.sleep(wait_time)
+                retries += 1
+            else:
+                return response
+
+    def _request_slot(self) -> asyncio.Semaphore:
+        """Semaphore bounding in-flight async requests, created on first use."""
+        if self._async_limit is None:
+            self._async_limit = asyncio.Semaphore(_ASYNC_CONCURRENCY)
+        return self._async_limit
+
+    async def _get_page_async(self, client: httpx.AsyncClient, url: str, params: Dict = None) -> Tuple[Any, Optional[str]]:
+        """Async counterpart of _get_page, sharing the conditional-request cache."""
+        key, cached = self._cache_lookup(url, params)
+        response = await self._get_async(client, url, params, cached[0] if cached else None)
+        if wait_time := self._rate_limit_wait(response):
+            await asyncio.sleep(wait_time)
+        return self._page_result(response, key, cached)
+
+    async def _fetch_json_async(self, client: httpx.AsyncClient, url: str, description: str, default: Any,
+                                params: Dict = None) -> Any:
+        """GET a single JSON document, logging failures and returning default instead."""
+        try:
+            return (await self._get_page_async(client, url, params))[0]
+        except Exception as e:
+            logging.error(f"Error fetching {description}: {str(e)}")
+            return default
+
+    async def _get_repo_contents_async(self, client: httpx.AsyncClient, repo: str, ref: str = 'HEAD') -> List[Dict]:
+        """Async counterpart of get_repo_contents."""
+        url = f'{self.base_url}/repos/{self.org}/{repo}/git/trees/{ref}'
+        tree = await self._fetch_json_async(client, url, f"contents for {repo}@{ref}", None, {'recursive': 1})
+        return self._tree_contents(repo, ref, tree) if tree is not None else []
+
+    async def _get_branch_dates_async(self, client: httpx.AsyncClient, repo: str) -> Dict[str, Optional[str]]:
+        """Async counterpart of get_branches_with_last_commit, including its REST fallback."""
+        url = f'{self.base_url}/graphql'
+        variables = {'owner': self.org, 'name': repo, 'cursor': None}
+        branch_dates = {}
+        try:
+            while True:
+                async with self._request_slot():
+                    response = await client.post(
+                        url, content=orjson.dumps({'query': _BRANCH_DATES_QUERY, 'variables': variables})
+                    )
+                variables['cursor'] = self._read_branch_dates(response, branch_dates)
+                if variables['cursor'] is None:
+                    return branch_dates
+        except Exception as e:
+            logging.warning(f"GraphQL branch query failed for {repo}, falling back to REST: {str(e)}")
         
-        # Effort Metrics
-        for metric, definition in MetricDefinitions.EFFORT_METRICS.items():
-            definitions_data.append({
-                'Category': 'Effort Analysis',
-                'Metric': metric,
-                'Definition': definition
-            })
+        branches_url = f'{self.base_url}/repos/{self.org}/{repo}/branches'
+        try:
+            branches, next_url = await self._get_page_async(client, branches_url, {'per_page': 100})
+            while next_url:
+                page, next_url = await self._get_page_async(client, next_url)
+                branches.extend(page)
+        except Exception as e:
+            logging.error(f"Error fetching branches for {repo}: {str(e)}")
+            return {}
         
-        # Ratings
-        for rating, definition in MetricDefinitions.RATINGS.items():
-            definitions_data.append({
-                'Category': 'Ratings',
-                'Metric': rating,
-                'Definition': definition
-            })
+        responses = await asyncio.gather(*(
+            self._fetch_json_async(client, f"{branches_url}/{branch['name']}", f"branch info for {repo}/{branch['name']}", None)
+            for branch in branches
+        ))
+        return {
+            branch['name']: self._rest_commit_date(
+                repo, branch['name'], self._checked_branch(repo, branch['name'], data) if data is not None else None
+            )
+            for branch, data in zip(branches, responses)
+        }
+
+    def export_to_excel(self, analyses: List[Dict], output_file: str):
+        """Export analyses to Excel with multiple sheets.
         
-        df = pd.DataFrame(definitions_data)
-        df.to_excel(writer, sheet_name='Definitions', index=False)
+        The workbook is built in write-only mode, so rows are streamed to disk
+        as they are appended instead of being held in memory as cell objects.
+        """
+        workbook = openpyxl.Workbook(write_only=True)
+        # Cells reference one registered style per role by name instead of each
+        # carrying its own font/fill/border that openpyxl has to hash and deduplicate
+        workbook.add_named_style(openpyxl.styles.NamedStyle(
+            name=_HEADER_STYLE, font=_HEADER_FONT, fill=_HEADER_FILL, border=_THIN_BORDER
+        ))
+        workbook.add_named_style(openpyxl.styles.NamedStyle(name=_BODY_STYLE, border=_THIN_BORDER))
+        # Every sheet but the Summary is plain data, so those skip openpyxl's
+        # cell layer and are rendered straight to XML
+        direct_writer = XlsxDirectWriter(workbook)
+        self._export_summary(analyses, workbook)
+        self._export_industry_standards(direct_writer)
+        self._export_metric_definitions(direct_writer)
+        self._export_detailed_metrics(analyses, direct_writer)
+        direct_writer.save(output_file)
+
+    def _create_sheet(self, workbook: openpyxl.Workbook, title: str, widths: Dict[str, float]):
+        """Create a write-only sheet; column widths must be set before any row is appended."""
+        worksheet = workbook.create_sheet(title)
+        worksheet.sheet_format.defaultRowHeight = _ROW_HEIGHT
+        worksheet.sheet_format.customHeight = True
+        for column, width in widths.items():
+            worksheet.column_dimensions[column].width = width
+        return worksheet
+
+    def _write_rows(self, worksheet, rows, width: int, row_heights: Optional[Dict[int, float]] = None):
+        """Stream rows into a write-only sheet, padded to width; the first row is the header."""
+        row_heights = row_heights or {}
+        for row_idx, values in enumerate(rows, start=1):
+            # Row dimensions are read as each row is written, so set them just before
+            if row_idx in row_heights:
+                worksheet.row_dimensions[row_idx].height = row_heights[row_idx]
+            worksheet.append([
+                self._styled_cell(worksheet, values[column] if column < len(values) else None, header=row_idx == 1)
+                for column in range(width)
+            ])
+
+    def _styled_cell(self, worksheet, value: Any, header: bool = False):
+        """Create a write-only cell with the header or bordered body style."""
+        cell = openpyxl.cell.WriteOnlyCell(worksheet, value)
+        cell.style = _HEADER_STYLE if header else _BODY_STYLE
+        return cell
+
+    def _write_dataframe(self, workbook: openpyxl.Workbook, df: pd.DataFrame, title: str, widths: Dict[str, float],
+                         row_heights: Optional[Dict[int, float]] = None):
+        """Write a DataFrame, header included, to a new formatted sheet."""
+        worksheet = self._create_sheet(workbook, title, widths)
+        # Lazily chained so rows go straight from the frame to the sheet without
+        # an intermediate list of every row
+        rows = chain([tuple(df.columns)], df.itertuples(index=False, name=None))
+        self._write_rows(worksheet, rows, len(df.columns), row_heights)
+
+    def _export_summary(self, analyses: List[Dict], workbook: openpyxl.Workbook):
+        """Export summary data to Excel."""
+        # Build whole columns at once rather than one dict per row
+        aberrancy = [analysis['aberrancy_metrics'] for analysis in analyses]
+        quality_scores = np.fromiter(
+            (analysis['quality_metrics']['quality_score'] for analysis in analyses),
+            dtype=np.float64,
+            count=len(analyses)
+        )
+        risk_factors = ['\n'.join(metrics['risk_factors']) for metrics in aberrancy]
+        df = pd.DataFrame({
+            'Repository': [analysis['repository'] for analysis in analyses],
+            'Quality Score': [round(score, 2) for score in quality_scores.tolist()],
+            'Aberrancy Score': [round(metrics['overall_aberrancy_score'], 2) for metrics in aberrancy],
+            'Industry Rating': _RATING_LABELS[np.searchsorted(_RATING_THRESHOLDS, quality_scores, side='right')],
+            'Risk Level': [metrics.get('aberrancy_rating', {}).get('risk_level', 'N/A') for metrics in aberrancy],
+            'Risk Factors': risk_factors,
+            'Analyzed At': [analysis['analyzed_at'] for analysis in analyses]
+        })
         
-        # Format the Definitions sheet
-        worksheet = writer.sheets['Definitions']
-        worksheet.column_dimensions['A'].width = 25
-        worksheet.column_dimensions['B'].width = 25
-        worksheet.column_dimensions['C'].width = 60
+        # Give multi-line risk factor cells room for every line (data starts on row 2)
+        row_heights = {
+            idx: _ROW_HEIGHT * (factors.count('\n') + 1)
+            for idx, factors in enumerate(risk_factors, start=2)
+            if '\n' in factors
+        }
+        self._write_dataframe(workbook, df, 'Summary', {
+            'A': 30, 'B': 15, 'C': 15, 'D': 20, 'E': 15, 'F': 40, 'G': 25
+        }, row_heights)
 
-    def _export_detailed_metrics(self, analyses: List[Dict], writer: pd.ExcelWriter):
+    def _export_industry_standards(self, writer: XlsxDirectWriter):
+        """Export industry standards to Excel."""
+        worksheet = self._create_sheet(writer.workbook, 'Standards', {'A': 20, 'B': 15, 'C': 30, 'D': 50})
+        writer.add_rendered(worksheet, _render_static_sheet(_build_standards_df, *self._style_ids(worksheet)))
+
+    def _export_metric_definitions(self, writer: XlsxDirectWriter):
+        """Export metric definitions to Excel."""
+        worksheet = self._create_sheet(writer.workbook, 'Definitions', {'A': 25, 'B': 25, 'C': 60})
+        writer.add_rendered(worksheet, _render_static_sheet(_build_definitions_df, *self._style_ids(worksheet)))
+
+    def _style_ids(self, worksheet) -> Tuple[int, int]:
+        """Workbook style indexes of the header and body styles, for direct-XML sheets."""
+        return (
+            self._styled_cell(worksheet, None, header=True).style_id,
+            self._styled_cell(worksheet, None).style_id
+        )
+
+    def _export_detailed_metrics(self, analyses: List[Dict], writer: XlsxDirectWriter):
         """Export detailed metrics with industry comparisons."""
         for analysis in analyses:
             repo_name = analysis['repository']
@@ -891,7 +1602,7 @@ class CodeQualityAnalyzer:
             
             aberrancy = analysis['aberrancy_metrics']
             
-            # Combine all metrics into one DataFrame
+            # Combine all metrics into one table, column by column
             metrics_data = {
                 'Section': [],
                 'Metric': [],
@@ -933,30 +1644,19 @@ class CodeQualityAnalyzer:
                 ]
             )
             
-            # Create DataFrame and write to Excel
-            df = pd.DataFrame(metrics_data)
-            df.to_excel(writer, sheet_name=sheet_name, index=False)
-            
-            # Format the sheet
-            worksheet = writer.sheets[sheet_name]
-            worksheet.column_dimensions['A'].width = 20
-            worksheet.column_dimensions['B'].width = 20
-            worksheet.column_dimensions['C'].width = 15
-            worksheet.column_dimensions['D'].width = 20
-            worksheet.column_dimensions['E'].width = 15
-            
-            # Add recommendations section
-            start_row = len(df) + 3
-            recommendations = pd.DataFrame({
-                'Section': ['Recommendations'],
-                'Details': [self._get_combined_recommendations(aberrancy['assessment_details'])]
-            })
-            recommendations.to_excel(
-                writer,
-                sheet_name=sheet_name,
-                startrow=start_row,
-                index=False
-            )
+            # Metrics table, two spacer rows, then the recommendations block.
+            # The columns are zipped straight into row tuples; a DataFrame per
+            # repository would only be built to be iterated again.
+            rows = [
+                tuple(metrics_data),
+                *zip(*metrics_data.values()),
+                (),
+                (),
+                ('Section', 'Details'),
+                ('Recommendations', self._get_combined_recommendations(aberrancy['assessment_details']))
+            ]
+            worksheet = self._create_sheet(writer.workbook, sheet_name, {'A': 20, 'B': 20, 'C': 15, 'D': 20, 'E': 15})
+            writer.add_sheet(worksheet, rows, len(metrics_data), *self._style_ids(worksheet))
 
     def _add_metric_section(self, metrics_data: Dict, section: str, assessment: Dict, metric_mappings: List[tuple]):
         """Add a section of metrics to the metrics data dictionary."""
@@ -1166,123 +1866,104 @@ class CodeQualityAnalyzer:
         
         return '\n'.join(recommendations)
 
-    def _format_excel_sheets(self, writer: pd.ExcelWriter):
-        """Apply final formatting to all sheets."""
-        workbook = writer.book
-        for worksheet in workbook.worksheets:
-            # Format header row
-            for cell in worksheet[1]:
-                cell.font = openpyxl.styles.Font(bold=True)
-                cell.fill = openpyxl.styles.PatternFill(
-                    start_color='CCE5FF',
-                    end_color='CCE5FF',
-                    fill_type='solid'
-                )
-            
-            # Add borders
-            thin_border = openpyxl.styles.Border(
-                left=openpyxl.styles.Side(style='thin'),
-                right=openpyxl.styles.Side(style='thin'),
-                top=openpyxl.styles.Side(style='thin'),
-                bottom=openpyxl.styles.Side(style='thin')
-            )
-            
-            for row in worksheet.iter_rows():
-                for cell in row:
-                    cell.border = thin_border
-                    
-            # Adjust row height
-            for row in worksheet.rows:
-                worksheet.row_dimensions[row[0].row].height = 15
-
     def get_code_frequency_stats(self, repo: str) -> List[List[int]]:
         """Get code frequency statistics."""
         url = f'{self.base_url}/repos/{self.org}/{repo}/stats/code_frequency'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get_json(url)
         except Exception as e:
             logging.error(f"Error fetching code frequency stats for {repo}: {str(e)}")
             return []
 
     def get_branches(self, repo: str) -> List[Dict]:
-        """Get repository branches."""
-        branches = []
-        page = 1
-        per_page = 100
+        """Get all repository branches, following pagination."""
+        url = f'{self.base_url}/repos/{self.org}/{repo}/branches'
+        try:
+            return self._paged_get(url)
+        except Exception as e:
+            logging.error(f"Error fetching branches for {repo}: {str(e)}")
+            return []
+
+    def get_branches_with_last_commit(self, repo: str) -> Dict[str, Optional[str]]:
+        """Map each branch name to the date of its last commit.
+        
+        Uses paginated GraphQL queries (100 branches per request) and falls
+        back to listing branches and fetching each one over REST.
+        """
+        try:
+            return self._get_branch_dates_graphql(repo)
+        except Exception as e:
+            logging.warning(f"GraphQL branch query failed for {repo}, falling back to REST: {str(e)}")
+        
+        branches = self.get_branches(repo)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            commit_infos = list(executor.map(
+                lambda branch: self.get_branch_last_commit(repo, branch['name']),
+                branches
+            ))
+        return {
+            branch['name']: self._rest_commit_date(repo, branch['name'], commit_info)
+            for branch, commit_info in zip(branches, commit_infos)
+        }
+
+    def _get_branch_dates_graphql(self, repo: str) -> Dict[str, Optional[str]]:
+        """Fetch branch last-commit dates through the GraphQL refs connection."""
+        url = f'{self.base_url}/graphql'
+        variables = {'owner': self.org, 'name': repo, 'cursor': None}
+        branch_dates = {}
         
         while True:
-            url = f'{self.base_url}/repos/{self.org}/{repo}/branches'
-            params = {
-                'page': page,
-                'per_page': per_page
-            }
-            
-            try:
-                response = requests.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                
-                batch = response.json()
-                if not batch:  # No more branches
-                    break
-                    
-                branches.extend(batch)
-                
-                if len(batch) < per_page:  # Last page
-                    break
-                    
-                page += 1
-                
-            except Exception as e:
-                logging.error(f"Error fetching branches for {repo} (page {page}): {str(e)}")
-                break
+            response = self.session.post(url, content=orjson.dumps({'query': _BRANCH_DATES_QUERY, 'variables': variables}))
+            variables['cursor'] = self._read_branch_dates(response, branch_dates)
+            if variables['cursor'] is None:
+                return branch_dates
+
+    def _read_branch_dates(self, response: httpx.Response, branch_dates: Dict[str, Optional[str]]) -> Optional[str]:
+        """Collect one GraphQL refs page into branch_dates, returning the next cursor if any."""
+        response.raise_for_status()
+        payload = self._decode(response)
+        if payload.get('errors'):
+            raise ValueError(payload['errors'][0].get('message', 'GraphQL error'))
         
-        return branches
+        refs = payload['data']['repository']['refs']
+        for node in refs['nodes']:
+            branch_dates[node['name']] = (node.get('target') or {}).get('committedDate')
+        
+        return refs['pageInfo']['endCursor'] if refs['pageInfo']['hasNextPage'] else None
+
+    def _rest_commit_date(self, repo: str, branch: str, commit_info: Optional[Dict]) -> Optional[str]:
+        """Extract the committer date from a REST branch response."""
+        try:
+            if commit_info and commit_info['commit'] and commit_info['commit']['committer']:
+                return commit_info['commit']['committer'].get('date')
+        except Exception as e:
+            logging.warning(f"Error processing branch {branch} in {repo}: {str(e)}")
+        return None
 
     def get_branch_last_commit(self, repo: str, branch: str) -> Dict:
         """Get last commit information for a branch."""
         url = f'{self.base_url}/repos/{self.org}/{repo}/branches/{branch}'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            
-            # Validate the response structure
-            if not isinstance(data, dict):
-                logging.warning(f"Invalid response data structure for {repo}/{branch}")
-                return None
-            
-            if 'commit' not in data:
-                logging.warning(f"Missing commit data for {repo}/{branch}")
-                return None
-            
-            commit_data = data['commit']
-            if not isinstance(commit_data, dict):
-                logging.warning(f"Invalid commit data type for {repo}/{branch}")
-                return None
-            
-            if 'committer' not in commit_data:
-                logging.warning(f"Missing committer data for {repo}/{branch}")
-                return None
-            
-            return data
-            
+            data = self._get_json(url)
         except Exception as e:
             logging.error(f"Error fetching branch info for {repo}/{branch}: {str(e)}")
             return None
+        return self._checked_branch(repo, branch, data)
+
+    def _checked_branch(self, repo: str, branch: str, data: Any) -> Optional[Dict]:
+        """Return a branch response if it carries committer data, else None."""
+        # Responses are almost always well-formed, so validate by indexing
+        try:
+            data['commit']['committer']
+        except (KeyError, TypeError) as e:
+            logging.warning(f"Missing or invalid commit data for {repo}/{branch}: {e!r}")
+            return None
+        return data
 
     def _get_overall_rating(self, analysis: Dict) -> str:
         """Calculate overall rating based on all metrics."""
         score = analysis['quality_metrics']['quality_score']
-        if score >= 90:
-            return 'Excellent (Top 10%)'
-        elif score >= 80:
-            return 'Good (Top 25%)'
-        elif score >= 70:
-            return 'Average (Top 50%)'
-        else:
-            return 'Below Average'
+        return _RATING_LABELS[bisect_right(_RATING_THRESHOLDS, score)]
 
     def _get_industry_standards(self, section: str) -> Dict[str, str]:
         """Get industry standards for a given section."""
@@ -1316,20 +1997,25 @@ def main():
     repos_str = os.getenv('GITHUB_REPOS')
     repos_file = os.getenv('GITHUB_REPOS_FILE')
     
-    repos = []
-    
     # Try to get repos from GITHUB_REPOS environment variable
-    if repos_str:
-        repos.extend([repo.strip() for repo in repos_str.split(',') if repo.strip()])
+    env_repos = [repo.strip() for repo in repos_str.split(',')] if repos_str else []
     
     # Try to get repos from GITHUB_REPOS_FILE
+    file_repos = []
     if repos_file and os.path.exists(repos_file):
         try:
             with open(repos_file, 'r') as f:
-                repos.extend([line.strip() for line in f if line.strip()])
+                file_repos = [line.strip() for line in f]
         except Exception as e:
             logging.error(f"Error reading repos file: {str(e)}")
     
+    # Drop blanks and duplicates in a single pass, preserving first-seen order
+    seen = set()
+    repos = [
+        repo for repo in chain(env_repos, file_repos)
+        if repo and not (repo in seen or seen.add(repo))
+    ]
+    
     if not all([token, org]):
         logging.error("Missing required environment variables: GITHUB_TOKEN and GITHUB_ORG")
         return
@@ -1339,20 +2025,20 @@ def main():
         return
     
     analyzer = CodeQualityAnalyzer(token, org)
-    analyses = []
-    
-    # Remove duplicates while preserving order
-    repos = list(dict.fromkeys(repos))
     
-    for repo in repos:
-        logging.info(f"Analyzing repository: {repo}")
-        analysis = analyzer.analyze_repository(repo)
-        analyses.append(analysis)
-    
-    # Export results
-    output_file = f"{org}_code_quality_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
-    analyzer.export_to_excel(analyses, output_file)
-    logging.info(f"Analysis completed and exported to {output_file}")
+    try:
+        try:
+            analyses = asyncio.run(analyzer.analyze_repositories_async(repos))
+        except Exception as e:
+            logging.error(f"Async analysis failed, falling back to threaded requests: {str(e)}")
+            analyses = analyzer.analyze_repositories(repos)
+        
+        # Export results; lazy metric groups still use the HTTP client here
+        output_file = f"{org}_code_quality_analysis_{datetime.now().strftime('%Y%m%d_%H%M%S')}.xlsx"
+        analyzer.export_to_excel(analyses, output_file)
+        logging.info(f"Analysis completed and exported to {output_file}")
+    finally:
+        analyzer.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
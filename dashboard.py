@@ -1,14 +1,13 @@
+from __future__ import annotations
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from pymongo import MongoClient
 from datetime import datetime, timedelta
 import os
+import orjson
 from dotenv import load_dotenv
 import logging
 from typing import Optional, Dict
-from plotly.subplots import make_subplots
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -17,25 +16,80 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
+# Commit series longer than this are resampled to weekly totals before plotting
+MAX_COMMIT_POINTS = 1000
+# Series longer than this are drawn with WebGL instead of SVG
+WEBGL_POINT_THRESHOLD = 500
+
+# Dashboard sections, in display order
+SECTIONS = ("Overview", "PR Metrics", "Code Quality", "Security", "Raw Data")
+
+# Keys read from the pr_metrics document, in chart order
+CYCLE_TIME_KEYS = ('total', 'closed', 'open', 'merged')
+PR_SIZE_KEYS = ('small', 'medium', 'large', 'xlarge')
+REVIEW_TIME_KEYS = ('avg_time_to_first_review', 'avg_review_time')
+
+# HTML for the topic and feature pills in the repository overview
+PILL_CONTAINER = (
+    '<div style="display: flex; flex-wrap: wrap; gap: 0.25rem; margin: 0.5rem 0;">'
+    '{pills}</div>'
+)
+TOPIC_PILL = (
+    '<span style="background-color: #e9ecef; padding: 0.15rem 0.5rem; '
+    'border-radius: 0.75rem; font-size: 0.8rem;">{label}</span>'
+)
+FEATURE_PILL = (
+    '<span style="background-color: #d1e7dd; color: #0f5132; padding: 0.15rem 0.5rem; '
+    'border-radius: 0.75rem; font-size: 0.8rem;">{label}</span>'
+)
+
 # MongoDB connection
 @st.cache_resource
 def get_mongodb_connection():
+    # Imported here so the driver loads once, with the cached connection
+    from pymongo import MongoClient, ASCENDING, DESCENDING
+    
     try:
         mongo_uri = os.getenv('MONGO_URI')
         if not mongo_uri:
             raise ValueError("MONGO_URI environment variable not set")
         
-        client = MongoClient(mongo_uri)
+        # A small pool is enough for one dashboard process; fail fast when the
+        # server is unreachable and compress the large repository documents
+        client = MongoClient(
+            mongo_uri,
+            maxPoolSize=10,
+            minPoolSize=1,
+            serverSelectionTimeoutMS=2000,
+            compressors='zlib',
+            connect=True
+        )
         db = client.get_database()
-        return {
+        collections = {
             'github': db['github'],
             'sonar': db['sonar'],
             'nexus': db['nexus']
         }
+        
+        # Supports the "latest document per repository" lookups and the
+        # repository listing; do not drop it. create_index is a no-op when
+        # the index already exists.
+        for name, collection in collections.items():
+            try:
+                collection.create_index(
+                    [('repository', ASCENDING), ('timestamp', DESCENDING)],
+                    name='repository_timestamp',
+                    background=True
+                )
+            except Exception as e:
+                logger.warning(f"Could not create index on {name}: {str(e)}")
+        
+        return collections
     except Exception as e:
         logger.error(f"Error connecting to MongoDB: {str(e)}")
         return None
 
+@st.cache_data(ttl=300, show_spinner=False)
 def get_repositories():
     """Get list of all repositories from GitHub collection."""
     try:
@@ -43,11 +97,19 @@ def get_repositories():
         if not collections:
             return []
         
-        return list(collections['github'].distinct('repository'))
+        # Sorting on the index prefix lets the server walk the
+        # repository/timestamp index instead of scanning documents
+        pipeline = [
+            {'$sort': {'repository': 1}},
+            {'$group': {'_id': '$repository'}},
+            {'$sort': {'_id': 1}}
+        ]
+        return [doc['_id'] for doc in collections['github'].aggregate(pipeline)]
     except Exception as e:
         logger.error(f"Error getting repositories: {str(e)}")
         return []
 
+@st.cache_data(ttl=60, show_spinner=False)
 def get_repository_data(repo_name: str) -> Optional[Dict]:
     """Get latest data for a repository from all collections."""
     try:
@@ -55,38 +117,64 @@ def get_repository_data(repo_name: str) -> Optional[Dict]:
         if not collections:
             return None
         
-        # Get latest data from each collection
-        github_data = collections['github'].find_one(
-            {'repository': repo_name},
-            sort=[('timestamp', -1)]
-        )
+        # Fetch the latest document from every collection in one round trip
+        def latest(source: str) -> list:
+            return [
+                {'$match': {'repository': repo_name}},
+                {'$sort': {'timestamp': -1}},
+                {'$limit': 1},
+                {'$project': {'_id': 0, 'data': 1, '_src': {'$literal': source}}}
+            ]
         
-        sonar_data = collections['sonar'].find_one(
-            {'repository': repo_name},
-            sort=[('timestamp', -1)]
-        )
-        
-        nexus_data = collections['nexus'].find_one(
-            {'repository': repo_name},
-            sort=[('timestamp', -1)]
-        )
+        pipeline = latest('github')
+        for source in ('sonar', 'nexus'):
+            pipeline.append({'$unionWith': {
+                'coll': collections[source].name,
+                'pipeline': latest(source)
+            }})
         
         # Extract the data field from each document
-        return {
-            'github': github_data.get('data') if github_data else None,
-            'sonar': sonar_data.get('data') if sonar_data else None,
-            'nexus': nexus_data.get('data') if nexus_data else None
-        }
+        result = {'github': None, 'sonar': None, 'nexus': None}
+        for doc in collections['github'].aggregate(pipeline):
+            result[doc['_src']] = doc.get('data')
+        return result
     except Exception as e:
         logger.error(f"Error getting repository data: {str(e)}")
         return None
 
+@st.cache_data(ttl=60, show_spinner=False)
+def get_raw_json(repo_name: str, source: str) -> str:
+    """Serialize one collection's data for a repository as indented JSON."""
+    repo_data = get_repository_data(repo_name) or {}
+    return orjson.dumps(
+        repo_data.get(source),
+        default=str,
+        option=orjson.OPT_INDENT_2
+    ).decode()
+
+def _bar_figure(x, y, title: str, x_title: str, y_title: str) -> go.Figure:
+    """Build a single-trace bar chart."""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Bar(x=x, y=y))
+    fig.update_layout(title_text=title, xaxis_title=x_title, yaxis_title=y_title)
+    return fig
+
+def _pie_figure(labels, values, title: str) -> go.Figure:
+    """Build a single-trace pie chart."""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Pie(labels=labels, values=values))
+    fig.update_layout(title_text=title)
+    return fig
+
 def create_pr_metrics_chart(data: Dict) -> Optional[go.Figure]:
     """Create a chart for PR metrics."""
     try:
         if not data or 'pr_metrics' not in data:
             return None
 
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+        
         pr_metrics = data['pr_metrics']
         
         # Create subplots with compatible chart types
@@ -111,104 +199,75 @@ def create_pr_metrics_chart(data: Dict) -> Optional[go.Figure]:
             pr_metrics.get('closed_prs', 0),
             pr_metrics.get('merged_prs', 0)
         ]
-        fig.add_trace(
-            go.Pie(
-                labels=states,
-                values=values,
-                name='PR States',
-                hole=0.4
-            ),
-            row=1, col=1
+        state_pie = go.Pie(
+            labels=states,
+            values=values,
+            name='PR States',
+            hole=0.4
         )
 
         # PR Cycle Times (Bar Chart)
-        cycle_times = pr_metrics.get('avg_cycle_times', {})
+        avg_cycle_times = pr_metrics.get('avg_cycle_times', {})
+        median_cycle_times = pr_metrics.get('median_cycle_times', {})
         states = ['Total', 'Closed', 'Open', 'Merged']
-        avg_times = [
-            cycle_times.get('total', 0),
-            cycle_times.get('closed', 0),
-            cycle_times.get('open', 0),
-            cycle_times.get('merged', 0)
-        ]
-        median_times = [
-            pr_metrics.get('median_cycle_times', {}).get('total', 0),
-            pr_metrics.get('median_cycle_times', {}).get('closed', 0),
-            pr_metrics.get('median_cycle_times', {}).get('open', 0),
-            pr_metrics.get('median_cycle_times', {}).get('merged', 0)
-        ]
-
-        fig.add_trace(
-            go.Bar(
-                name='Average Cycle Time',
-                x=states,
-                y=avg_times,
-                text=[f'{t:.1f}h' for t in avg_times],
-                textposition='auto'
-            ),
-            row=1, col=2
+        avg_times = [avg_cycle_times.get(k, 0) for k in CYCLE_TIME_KEYS]
+        median_times = [median_cycle_times.get(k, 0) for k in CYCLE_TIME_KEYS]
+        avg_bar = go.Bar(
+            name='Average Cycle Time',
+            x=states,
+            y=avg_times,
+            text=[f'{t:.1f}h' for t in avg_times],
+            textposition='auto'
         )
-
-        fig.add_trace(
-            go.Bar(
-                name='Median Cycle Time',
-                x=states,
-                y=median_times,
-                text=[f'{t:.1f}h' for t in median_times],
-                textposition='auto'
-            ),
-            row=1, col=2
+        median_bar = go.Bar(
+            name='Median Cycle Time',
+            x=states,
+            y=median_times,
+            text=[f'{t:.1f}h' for t in median_times],
+            textposition='auto'
         )
 
         # PR Size Distribution (Bar Chart)
         size_dist = pr_metrics.get('pr_size_distribution', {})
         sizes = ['Small', 'Medium', 'Large', 'XLarge']
-        values = [
-            size_dist.get('small', 0),
-            size_dist.get('medium', 0),
-            size_dist.get('large', 0),
-            size_dist.get('xlarge', 0)
-        ]
-        fig.add_trace(
-            go.Bar(
-                x=sizes,
-                y=values,
-                text=values,
-                textposition='auto'
-            ),
-            row=2, col=1
+        values = [size_dist.get(k, 0) for k in PR_SIZE_KEYS]
+        size_bar = go.Bar(
+            x=sizes,
+            y=values,
+            text=values,
+            textposition='auto'
         )
 
         # Review Times (Bar Chart)
         review_time = pr_metrics.get('review_time', {})
-        times = [
-            review_time.get('avg_time_to_first_review', 0),
-            review_time.get('avg_review_time', 0)
-        ]
+        times = [review_time.get(k, 0) for k in REVIEW_TIME_KEYS]
         labels = ['Time to First Review', 'Average Review Time']
-        fig.add_trace(
-            go.Bar(
-                x=labels,
-                y=times,
-                text=[f'{t:.1f}h' for t in times],
-                textposition='auto'
-            ),
-            row=2, col=2
+        review_bar = go.Bar(
+            x=labels,
+            y=times,
+            text=[f'{t:.1f}h' for t in times],
+            textposition='auto'
+        )
+
+        # Add all traces in one batch so the figure is validated once
+        fig.add_traces(
+            [state_pie, avg_bar, median_bar, size_bar, review_bar],
+            rows=[1, 1, 1, 2, 2],
+            cols=[1, 2, 2, 1, 2]
         )
 
-        # Update layout
+        # Update layout and y-axis titles
         fig.update_layout(
             height=800,
             showlegend=True,
             title_text='Pull Request Metrics',
             barmode='group',
-            margin=dict(t=100, b=50, l=50, r=50)
+            margin=dict(t=100, b=50, l=50, r=50),
+            yaxis_title_text='Hours',
+            yaxis2_title_text='Count',
+            yaxis3_title_text='Hours'
         )
 
-        # Update y-axis titles
-        fig.update_yaxes(title_text="Hours", row=1, col=2)
-        fig.update_yaxes(title_text="Count", row=2, col=1)
-        fig.update_yaxes(title_text="Hours", row=2, col=2)
-
         return fig
     except Exception as e:
         logging.error(f"Error creating PR metrics chart: {str(e)}")
@@ -223,26 +282,30 @@ def create_commit_activity_chart(data):
     if not commit_stats:
         return None
     
-    # Create a DataFrame from the dates dictionary
-    dates_df = pd.DataFrame({
-        'Date': list(commit_stats.get('dates', {}).keys()),
-        'Commits': list(commit_stats.get('dates', {}).values())
-    })
+    # Build a date-indexed series from the dates dictionary in one pass
+    commits = pd.Series(commit_stats.get('dates') or {})
     
-    if dates_df.empty:
+    if commits.empty:
         return None
     
-    # Convert Date column to datetime
-    dates_df['Date'] = pd.to_datetime(dates_df['Date'])
-    
-    # Sort by date
-    dates_df = dates_df.sort_values('Date')
-    
-    fig = px.line(
-        dates_df,
-        x='Date',
-        y='Commits',
-        title='Commit Activity Over Time'
+    commits.index = pd.to_datetime(commits.index)
+    commits = commits.sort_index()
+    
+    # Long histories are aggregated per week to keep the chart light
+    if len(commits) > MAX_COMMIT_POINTS:
+        commits = commits.resample('W').sum()
+    
+    import plotly.graph_objects as go
+    trace = go.Scattergl if len(commits) > WEBGL_POINT_THRESHOLD else go.Scatter
+    fig = go.Figure(trace(
+        x=commits.index,
+        y=commits.values,
+        mode='lines'
+    ))
+    fig.update_layout(
+        title_text='Commit Activity Over Time',
+        xaxis_title='Date',
+        yaxis_title='Commits'
     )
     
     return fig
@@ -252,36 +315,59 @@ def create_code_quality_chart(data):
     if not data:
         return None
     
-    metrics_df = pd.DataFrame({
-        'Metric': ['Code Smells', 'Bugs', 'Vulnerabilities', 'Coverage'],
-        'Count': [
-            data.get('code_smells', 0),
-            data.get('bugs', 0),
-            data.get('vulnerabilities', 0),
-            data.get('coverage', 0)
-        ]
-    })
+    counts = [
+        data.get('code_smells', 0),
+        data.get('bugs', 0),
+        data.get('vulnerabilities', 0),
+        data.get('coverage', 0)
+    ]
     
-    fig = px.bar(metrics_df, x='Metric', y='Count', title='Code Quality Metrics')
-    return fig
+    return _bar_figure(
+        ['Code Smells', 'Bugs', 'Vulnerabilities', 'Coverage'], counts,
+        'Code Quality Metrics', 'Metric', 'Count'
+    )
 
 def create_security_chart(data):
     """Create security metrics chart."""
     if not data:
         return None
     
-    security_df = pd.DataFrame({
-        'Severity': ['Critical', 'High', 'Medium', 'Low'],
-        'Count': [
-            data.get('critical_vulnerabilities', 0),
-            data.get('high_vulnerabilities', 0),
-            data.get('medium_vulnerabilities', 0),
-            data.get('low_vulnerabilities', 0)
-        ]
-    })
+    counts = [
+        data.get('critical_vulnerabilities', 0),
+        data.get('high_vulnerabilities', 0),
+        data.get('medium_vulnerabilities', 0),
+        data.get('low_vulnerabilities', 0)
+    ]
     
-    fig = px.bar(security_df, x='Severity', y='Count', title='Security Vulnerabilities')
-    return fig
+    return _bar_figure(
+        ['Critical', 'High', 'Medium', 'Low'], counts,
+        'Security Vulnerabilities', 'Severity', 'Count'
+    )
+
+def _format_date(value) -> str:
+    """Format an ISO timestamp as a date, or N/A when missing."""
+    if not value:
+        return 'N/A'
+    if isinstance(value, str):
+        # ISO 8601 strings start with the YYYY-MM-DD date
+        return value[:10]
+    return value.strftime('%Y-%m-%d')
+
+# Overview metric rows: (label, repo_stats key, default, formatter)
+OVERVIEW_METRICS = (
+    (
+        ('Stars', 'stars', 0, None),
+        ('Forks', 'forks', 0, None),
+        ('Watchers', 'watchers', 0, None),
+        ('Open Issues', 'open_issues', 0, None),
+        ('Size', 'size', 0, lambda size: f"{size} KB"),
+        ('Language', 'language', 'N/A', None)
+    ),
+    (
+        ('Created', 'created_at', None, _format_date),
+        ('Last Updated', 'updated_at', None, _format_date)
+    )
+)
 
 def create_repo_overview(data):
     """Create repository overview section."""
@@ -291,32 +377,10 @@ def create_repo_overview(data):
     repo_stats = data.get('repo_stats', {})
     
     # Create a more compact layout with 2 rows of metrics
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        st.metric("Stars", repo_stats.get('stars', 0))
-    with col2:
-        st.metric("Forks", repo_stats.get('forks', 0))
-    with col3:
-        st.metric("Watchers", repo_stats.get('watchers', 0))
-    with col4:
-        st.metric("Open Issues", repo_stats.get('open_issues', 0))
-    with col5:
-        st.metric("Size", f"{repo_stats.get('size', 0)} KB")
-    with col6:
-        st.metric("Language", repo_stats.get('language', 'N/A'))
-    
-    # Second row of metrics
-    col1, col2, col3, col4, col5, col6 = st.columns(6)
-    
-    with col1:
-        created_at = repo_stats.get('created_at')
-        created_date = pd.to_datetime(created_at).strftime('%Y-%m-%d') if created_at else 'N/A'
-        st.metric("Created", created_date)
-    with col2:
-        updated_at = repo_stats.get('updated_at')
-        updated_date = pd.to_datetime(updated_at).strftime('%Y-%m-%d') if updated_at else 'N/A'
-        st.metric("Last Updated", updated_date)
+    for row in OVERVIEW_METRICS:
+        for col, (label, key, default, formatter) in zip(st.columns(6), row):
+            value = repo_stats.get(key, default)
+            col.metric(label, formatter(value) if formatter else value)
     
     # Repository description with compact styling
     description = repo_stats.get('description', 'No description available')
@@ -339,28 +403,8 @@ def create_repo_overview(data):
     with col1:
         topics = repo_stats.get('topics', [])
         if topics:
-            st.markdown("""
-                <div style="
-                    display: flex;
-                    flex-wrap: wrap;
-                    gap: 0.25rem;
-                    margin: 0.5rem 0;
-                ">
-            """, unsafe_allow_html=True)
-            
-            for topic in topics:
-                st.markdown(f"""
-                    <span style="
-                        background-color: #e9ecef;
-                        padding: 0.15rem 0.5rem;
-                        border-radius: 0.75rem;
-                        font-size: 0.8rem;
-                    ">
-                        {topic}
-                    </span>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
+            pills = ''.join(TOPIC_PILL.format(label=topic) for topic in topics)
+            st.markdown(PILL_CONTAINER.format(pills=pills), unsafe_allow_html=True)
     
     with col2:
         features = {
@@ -373,29 +417,8 @@ def create_repo_overview(data):
         
         enabled_features = [k for k, v in features.items() if v]
         if enabled_features:
-            st.markdown("""
-                <div style="
-                    display: flex;
-                    flex-wrap: wrap;
-                    gap: 0.25rem;
-                    margin: 0.5rem 0;
-                ">
-            """, unsafe_allow_html=True)
-            
-            for feature in enabled_features:
-                st.markdown(f"""
-                    <span style="
-                        background-color: #d1e7dd;
-                        color: #0f5132;
-                        padding: 0.15rem 0.5rem;
-                        border-radius: 0.75rem;
-                        font-size: 0.8rem;
-                    ">
-                        {feature}
-                    </span>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("</div>", unsafe_allow_html=True)
+            pills = ''.join(FEATURE_PILL.format(label=feature) for feature in enabled_features)
+            st.markdown(PILL_CONTAINER.format(pills=pills), unsafe_allow_html=True)
 
 def create_contributors_chart(data):
     """Create contributors chart."""
@@ -407,21 +430,14 @@ def create_contributors_chart(data):
         return None
     
     # Get top 10 contributors
-    top_contributors = sorted(
-        contributors['contributors'],
-        key=lambda x: x['contributions'],
-        reverse=True
-    )[:10]
-    
-    df = pd.DataFrame(top_contributors)
-    fig = px.bar(
-        df,
-        x='login',
-        y='contributions',
-        title='Top 10 Contributors',
-        labels={'login': 'Contributor', 'contributions': 'Number of Contributions'}
+    df = pd.DataFrame(contributors['contributors'])
+    if df.empty:
+        return None
+    df = df.nlargest(10, 'contributions')
+    return _bar_figure(
+        df['login'], df['contributions'],
+        'Top 10 Contributors', 'Contributor', 'Number of Contributions'
     )
-    return fig
 
 def create_branches_chart(data):
     """Create branches chart."""
@@ -433,21 +449,14 @@ def create_branches_chart(data):
         return None
     
     # Count protected vs unprotected branches
-    protected = sum(1 for b in branches['branches'] if b['protected'])
-    unprotected = len(branches['branches']) - protected
-    
-    df = pd.DataFrame({
-        'Type': ['Protected', 'Unprotected'],
-        'Count': [protected, unprotected]
-    })
-    
-    fig = px.pie(
-        df,
-        values='Count',
-        names='Type',
-        title='Branch Protection Status'
+    branches_df = pd.DataFrame(branches['branches'], columns=['protected'])
+    protected = int(branches_df['protected'].sum())
+    unprotected = len(branches_df) - protected
+    
+    return _pie_figure(
+        ['Protected', 'Unprotected'], [protected, unprotected],
+        'Branch Protection Status'
     )
-    return fig
 
 def create_releases_chart(data):
     """Create releases chart."""
@@ -459,22 +468,15 @@ def create_releases_chart(data):
         return None
     
     # Count releases by type
-    prereleases = sum(1 for r in releases['releases'] if r['prerelease'])
-    drafts = sum(1 for r in releases['releases'] if r['draft'])
-    published = len(releases['releases']) - prereleases - drafts
-    
-    df = pd.DataFrame({
-        'Type': ['Published', 'Pre-releases', 'Drafts'],
-        'Count': [published, prereleases, drafts]
-    })
-    
-    fig = px.bar(
-        df,
-        x='Type',
-        y='Count',
-        title='Release Types'
+    releases_df = pd.DataFrame(releases['releases'], columns=['prerelease', 'draft'])
+    prereleases = int(releases_df['prerelease'].sum())
+    drafts = int(releases_df['draft'].sum())
+    published = len(releases_df) - prereleases - drafts
+    
+    return _bar_figure(
+        ['Published', 'Pre-releases', 'Drafts'], [published, prereleases, drafts],
+        'Release Types', 'Type', 'Count'
     )
-    return fig
 
 def create_issues_chart(data):
     """Create issues chart."""
@@ -485,22 +487,81 @@ def create_issues_chart(data):
     if not issue_stats:
         return None
     
-    df = pd.DataFrame({
-        'Status': ['Open', 'Closed'],
-        'Count': [
-            issue_stats.get('open_issues', 0),
-            issue_stats.get('closed_issues', 0)
-        ]
-    })
+    counts = [
+        issue_stats.get('open_issues', 0),
+        issue_stats.get('closed_issues', 0)
+    ]
+    
+    return _pie_figure(['Open', 'Closed'], counts, 'Issue Status Distribution')
+
+# Overview grid: (builder, row, col, has cartesian axes)
+OVERVIEW_CHARTS = (
+    (create_contributors_chart, 1, 1, True),
+    (create_commit_activity_chart, 1, 2, True),
+    (create_branches_chart, 2, 1, False),
+    (create_releases_chart, 2, 2, True),
+    (create_issues_chart, 3, 1, False)
+)
+
+def create_overview_chart(data):
+    """Combine the overview charts into a single subplot figure."""
+    from plotly.subplots import make_subplots
+    
+    if not data:
+        return None
+    
+    charts = [builder(data) for builder, _, _, _ in OVERVIEW_CHARTS]
+    if not any(charts):
+        return None
     
-    fig = px.pie(
-        df,
-        values='Count',
-        names='Status',
-        title='Issue Status Distribution'
+    fig = make_subplots(
+        rows=3, cols=2,
+        subplot_titles=[chart.layout.title.text if chart else '' for chart in charts],
+        specs=[
+            [{"type": "xy"}, {"type": "xy"}],
+            [{"type": "domain"}, {"type": "xy"}],
+            [{"type": "domain", "colspan": 2}, None]
+        ],
+        vertical_spacing=0.08
     )
+    
+    for chart, (_, row, col, cartesian) in zip(charts, OVERVIEW_CHARTS):
+        if not chart:
+            continue
+        fig.add_traces(list(chart.data), rows=row, cols=col)
+        if cartesian:
+            fig.update_xaxes(title_text=chart.layout.xaxis.title.text, row=row, col=col)
+            fig.update_yaxes(title_text=chart.layout.yaxis.title.text, row=row, col=col)
+    
+    # Pie legends would merge into one, so label the slices instead
+    fig.update_traces(textinfo='label+percent', selector=dict(type='pie'))
+    fig.update_layout(
+        height=1200,
+        showlegend=False,
+        margin=dict(t=50, b=50, l=50, r=50)
+    )
+    
     return fig
 
+CHART_BUILDERS = {
+    'pr_metrics': create_pr_metrics_chart,
+    'commit_activity': create_commit_activity_chart,
+    'code_quality': create_code_quality_chart,
+    'security': create_security_chart,
+    'contributors': create_contributors_chart,
+    'branches': create_branches_chart,
+    'releases': create_releases_chart,
+    'issues': create_issues_chart,
+    'overview': create_overview_chart
+}
+
+@st.cache_data(ttl=60, show_spinner=False)
+def get_chart(repo_name: str, source: str, chart: str) -> Optional[Dict]:
+    """Build a chart for a repository and cache its figure as a dict."""
+    repo_data = get_repository_data(repo_name) or {}
+    fig = CHART_BUILDERS[chart](repo_data.get(source))
+    return fig.to_dict() if fig else None
+
 def main():
     st.set_page_config(
         page_title="Repository Analysis Dashboard",
@@ -528,50 +589,30 @@ def main():
             sonar_data = repo_data['sonar']
             nexus_data = repo_data['nexus']
             
-            # Create tabs for different sections
-            tab1, tab2, tab3, tab4, tab5 = st.tabs([
-                "Overview", "PR Metrics", "Code Quality", "Security", "Raw Data"
-            ])
+            # Streamlit runs every st.tabs body on each rerun, so pick the
+            # section with a radio and only build what is shown
+            section = st.radio(
+                "Section",
+                SECTIONS,
+                horizontal=True,
+                label_visibility="collapsed",
+                key="section"
+            )
             
-            with tab1:
+            if section == "Overview":
                 if github_data:
                     create_repo_overview(github_data)
                     
-                    # Create a 2x2 grid for charts
-                    col1, col2 = st.columns(2)
-                    
-                    with col1:
-                        # Contributors section
-                        contributors_chart = create_contributors_chart(github_data)
-                        if contributors_chart:
-                            st.plotly_chart(contributors_chart, use_container_width=True)
-                        
-                        # Branches section
-                        branches_chart = create_branches_chart(github_data)
-                        if branches_chart:
-                            st.plotly_chart(branches_chart, use_container_width=True)
-                    
-                    with col2:
-                        # Commit activity section
-                        commit_chart = create_commit_activity_chart(github_data)
-                        if commit_chart:
-                            st.plotly_chart(commit_chart, use_container_width=True)
-                        
-                        # Releases section
-                        releases_chart = create_releases_chart(github_data)
-                        if releases_chart:
-                            st.plotly_chart(releases_chart, use_container_width=True)
-                    
-                    # Issues section (full width)
-                    issues_chart = create_issues_chart(github_data)
-                    if issues_chart:
-                        st.plotly_chart(issues_chart, use_container_width=True)
+                    # Overview charts share a single figure
+                    overview_chart = get_chart(selected_repo, 'github', 'overview')
+                    if overview_chart:
+                        st.plotly_chart(overview_chart, use_container_width=True)
                 else:
                     st.info("No GitHub data available")
             
-            with tab2:
+            elif section == "PR Metrics":
                 if github_data:
-                    pr_chart = create_pr_metrics_chart(github_data)
+                    pr_chart = get_chart(selected_repo, 'github', 'pr_metrics')
                     if pr_chart:
                         st.plotly_chart(pr_chart, use_container_width=True)
                     else:
@@ -579,9 +620,9 @@ def main():
                 else:
                     st.info("No GitHub data available")
             
-            with tab3:
+            elif section == "Code Quality":
                 if sonar_data:
-                    quality_chart = create_code_quality_chart(sonar_data)
+                    quality_chart = get_chart(selected_repo, 'sonar', 'code_quality')
                     if quality_chart:
                         st.plotly_chart(quality_chart, use_container_width=True)
                     else:
@@ -589,9 +630,9 @@ def main():
                 else:
                     st.info("No SonarQube data available")
             
-            with tab4:
+            elif section == "Security":
                 if nexus_data:
-                    security_chart = create_security_chart(nexus_data)
+                    security_chart = get_chart(selected_repo, 'nexus', 'security')
                     if security_chart:
                         st.plotly_chart(security_chart, use_container_width=True)
                     else:
@@ -599,20 +640,20 @@ def main():
                 else:
                     st.info("No NexusIQ data available")
             
-            with tab5:
+            elif section == "Raw Data":
                 col1, col2, col3 = st.columns(3)
                 
-                with col1:
-                    st.subheader("GitHub Data")
-                    st.json(github_data)
-                
-                with col2:
-                    st.subheader("SonarQube Data")
-                    st.json(sonar_data)
-                
-                with col3:
-                    st.subheader("NexusIQ Data")
-                    st.json(nexus_data)
+                # Raw documents can be large, so only serialize them on request
+                raw_sources = [
+                    (col1, "GitHub Data", 'github'),
+                    (col2, "SonarQube Data", 'sonar'),
+                    (col3, "NexusIQ Data", 'nexus')
+                ]
+                for col, title, source in raw_sources:
+                    with col:
+                        with st.expander(title, expanded=False):
+                            if st.checkbox("Show raw JSON", key=f"raw_{source}"):
+                                st.code(get_raw_json(selected_repo, source), language='json')
         else:
             st.error("No data available for the selected repository")
     else:
@@ -1,11 +1,16 @@
-import json
+import atexit
+import math
 import os
+import re
 import logging
-import pandas as pd
-from datetime import datetime
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import xlsxwriter
+from datetime import datetime, timezone
+from typing import Dict, List, Any, Optional, Tuple
 from dotenv import load_dotenv
-from pymongo import MongoClient
+from pymongo import MongoClient, ASCENDING, DESCENDING
 from pymongo.errors import ConnectionFailure, OperationFailure
 
 # Configure logging
@@ -15,12 +20,56 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder to handle datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Seconds a get_latest_* result is served from memory
+LATEST_CACHE_TTL = 60
+
+# GitHub document fields read by create_excel_report. store_github_data nests
+# the insights under 'data'; documents with them at the top level also work
+REPORT_GITHUB_FIELDS = {
+    'timestamp': 1,
+    'data.pr_metrics': 1,
+    'data.commit_activity': 1,
+    'pr_metrics': 1,
+    'commit_activity': 1
+}
+
+# Characters Excel does not allow in sheet names, and the name length limit
+INVALID_SHEET_CHARS = re.compile(r'[\[\]:*?/\\]')
+MAX_SHEET_NAME = 31
+CONTRIBUTORS_SUFFIX = '_Contributors'
+
+# One pooled client per URI, shared by every DataStorage in the process
+_clients: Dict[str, MongoClient] = {}
+_clients_lock = threading.Lock()
+# URIs whose collections have already had their indexes ensured
+_indexed_uris = set()
+
+def _get_client(mongo_uri: str) -> MongoClient:
+    """Return the shared MongoClient for a URI, creating it on first use."""
+    with _clients_lock:
+        client = _clients.get(mongo_uri)
+        if client is None:
+            client = MongoClient(
+                mongo_uri,
+                maxPoolSize=50,
+                minPoolSize=5,
+                maxIdleTimeMS=300_000,
+                socketTimeoutMS=45_000,
+                serverSelectionTimeoutMS=5_000,
+                retryWrites=True,
+                compressors='zstd,zlib'
+            )
+            _clients[mongo_uri] = client
+        return client
+
+@atexit.register
+def _close_clients():
+    """Close every shared MongoClient when the process exits."""
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+    for client in clients:
+        client.close()
 
 class DataStorage:
     """Handles data storage operations for repository analysis."""
@@ -29,6 +78,8 @@ class DataStorage:
         """Initialize data storage with MongoDB connection."""
         self.mongo_uri = mongo_uri
         self.logger = logging.getLogger(__name__)
+        # (collection name, repository) -> (expiry, latest document)
+        self._latest_cache: Dict[Tuple[str, str], Tuple[float, Optional[Dict]]] = {}
         self._initialize_mongodb()
     
     def _initialize_mongodb(self):
@@ -37,7 +88,7 @@ class DataStorage:
             if not self.mongo_uri:
                 raise ValueError("MONGO_URI environment variable not set")
             
-            self.client = MongoClient(self.mongo_uri)
+            self.client = _get_client(self.mongo_uri)
             self.db = self.client.get_database()
             
             # Initialize collections
@@ -45,6 +96,26 @@ class DataStorage:
             self.sonar_collection = self.db['sonar']
             self.nexus_collection = self.db['nexus']
             
+            # Serves the get_latest_* lookups and the report's repository
+            # scans. Ensured once per process and URI so later instances do not
+            # pay the round trips. Best effort: an unreachable server or missing
+            # createIndex permission must not stop read-only users
+            with _clients_lock:
+                needs_indexes = self.mongo_uri not in _indexed_uris
+                _indexed_uris.add(self.mongo_uri)
+            if needs_indexes:
+                try:
+                    for collection in (self.github_collection, self.sonar_collection, self.nexus_collection):
+                        collection.create_index(
+                            [('repository', ASCENDING), ('timestamp', DESCENDING)],
+                            name='repository_timestamp',
+                            background=True
+                        )
+                except Exception as e:
+                    self.logger.warning(f"Could not create MongoDB indexes: {str(e)}")
+                    with _clients_lock:
+                        _indexed_uris.discard(self.mongo_uri)
+            
             self.logger.info("Successfully initialized MongoDB connection and collections")
         except Exception as e:
             self.logger.error(f"Error initializing MongoDB: {str(e)}")
@@ -56,24 +127,9 @@ class DataStorage:
             if self.github_collection is None:
                 raise ValueError("GitHub collection not initialized")
             
-            # Prepare the document
-            document = {
-                'repository': repository,
-                'timestamp': datetime.utcnow(),
-                'data': {
-                    'repo_stats': data.get('repo_stats', {}),
-                    'pr_metrics': data.get('pr_metrics', {}),
-                    'commit_stats': data.get('commit_stats', {}),
-                    'contributors': data.get('contributors', {}),
-                    'branches': data.get('branches', {}),
-                    'releases': data.get('releases', {}),
-                    'issue_stats': data.get('issue_stats', {}),
-                    'commit_activity': data.get('commit_activity', {})
-                }
-            }
-            
             # Insert the document
-            result = self.github_collection.insert_one(document)
+            result = self.github_collection.insert_one(self._github_document(repository, data, datetime.now(timezone.utc)))
+            self._invalidate_latest(self.github_collection, [repository])
             self.logger.info(f"Stored GitHub data for repository {repository}")
             return result.acknowledged
         except Exception as e:
@@ -87,10 +143,11 @@ class DataStorage:
                 raise ValueError("SonarQube collection not initialized")
             
             # Add timestamp to data
-            data['timestamp'] = datetime.utcnow()
+            data['timestamp'] = datetime.now(timezone.utc)
             
             # Insert document
             result = self.sonar_collection.insert_one(data)
+            self._invalidate_latest(self.sonar_collection, [data.get('repository')])
             if result.acknowledged:
                 self.logger.info(f"Successfully stored SonarQube data for repository: {data.get('repository')}")
                 return True
@@ -108,10 +165,11 @@ class DataStorage:
                 raise ValueError("NexusIQ collection not initialized")
             
             # Add timestamp to data
-            data['timestamp'] = datetime.utcnow()
+            data['timestamp'] = datetime.now(timezone.utc)
             
             # Insert document
             result = self.nexus_collection.insert_one(data)
+            self._invalidate_latest(self.nexus_collection, [data.get('repository')])
             if result.acknowledged:
                 self.logger.info(f"Successfully stored NexusIQ data for repository: {data.get('repository')}")
                 return True
@@ -122,59 +180,161 @@ class DataStorage:
             self.logger.error(f"Error storing NexusIQ data: {str(e)}")
             return False
     
-    def get_latest_github_data(self, repository: str) -> Optional[Dict]:
-        """Get the latest GitHub data for a repository."""
+    def store_github_data_bulk(self, items: List[Tuple[str, Dict]]) -> bool:
+        """Store GitHub data for several repositories in a single request."""
         try:
             if self.github_collection is None:
                 raise ValueError("GitHub collection not initialized")
             
-            result = self.github_collection.find_one(
-                {'repository': repository},
-                sort=[('timestamp', -1)]
-            )
-            return result
+            if not items:
+                return True
+            
+            timestamp = datetime.now(timezone.utc)
+            documents = [self._github_document(repository, data, timestamp) for repository, data in items]
+            result = self.github_collection.insert_many(documents, ordered=False)
+            self._invalidate_latest(self.github_collection, [repository for repository, _ in items])
+            self.logger.info(f"Stored GitHub data for {len(result.inserted_ids)} repositories")
+            return result.acknowledged
         except Exception as e:
-            self.logger.error(f"Error getting latest GitHub data for {repository}: {str(e)}")
-            return None
+            self.logger.error(f"Error storing GitHub data in bulk: {str(e)}")
+            return False
     
-    def get_latest_sonar_data(self, repository: str) -> Optional[Dict]:
-        """Get the latest SonarQube data for a repository."""
+    def store_sonar_data_bulk(self, items: List[Dict]) -> bool:
+        """Store SonarQube data for several repositories in a single request."""
+        return self._insert_timestamped(self.sonar_collection, items, "SonarQube")
+    
+    def store_nexus_data_bulk(self, items: List[Dict]) -> bool:
+        """Store NexusIQ data for several repositories in a single request."""
+        return self._insert_timestamped(self.nexus_collection, items, "NexusIQ")
+    
+    def _insert_timestamped(self, collection, items: List[Dict], source: str) -> bool:
+        """Timestamp the documents and insert them with one unordered insert_many."""
         try:
-            if self.sonar_collection is None:
-                raise ValueError("SonarQube collection not initialized")
+            if collection is None:
+                raise ValueError(f"{source} collection not initialized")
             
-            result = self.sonar_collection.find_one(
-                {'repository': repository},
-                sort=[('timestamp', -1)]
-            )
-            return result
+            if not items:
+                return True
+            
+            # Insert copies: insert_many sets _id in place, and a caller retrying a
+            # failed batch must not resend those ids
+            timestamp = datetime.now(timezone.utc)
+            documents = [dict(data, timestamp=timestamp) for data in items]
+            
+            result = collection.insert_many(documents, ordered=False)
+            self._invalidate_latest(collection, [data.get('repository') for data in items])
+            self.logger.info(f"Stored {source} data for {len(result.inserted_ids)} repositories")
+            return result.acknowledged
         except Exception as e:
-            self.logger.error(f"Error getting latest SonarQube data for {repository}: {str(e)}")
-            return None
+            self.logger.error(f"Error storing {source} data in bulk: {str(e)}")
+            return False
+    
+    @staticmethod
+    def _github_document(repository: str, data: Dict, timestamp: datetime) -> Dict:
+        """Build the stored document for a repository's GitHub insights."""
+        return {
+            'repository': repository,
+            'timestamp': timestamp,
+            'data': {
+                'repo_stats': data.get('repo_stats', {}),
+                'pr_metrics': data.get('pr_metrics', {}),
+                'commit_stats': data.get('commit_stats', {}),
+                'contributors': data.get('contributors', {}),
+                'branches': data.get('branches', {}),
+                'releases': data.get('releases', {}),
+                'issue_stats': data.get('issue_stats', {}),
+                'commit_activity': data.get('commit_activity', {})
+            }
+        }
+    
+    def get_latest_github_data(self, repository: str) -> Optional[Dict]:
+        """Get the latest GitHub data for a repository."""
+        return self._get_latest(self.github_collection, repository, "GitHub")
+    
+    def get_latest_sonar_data(self, repository: str) -> Optional[Dict]:
+        """Get the latest SonarQube data for a repository."""
+        return self._get_latest(self.sonar_collection, repository, "SonarQube")
     
     def get_latest_nexus_data(self, repository: str) -> Optional[Dict]:
         """Get the latest NexusIQ data for a repository."""
+        return self._get_latest(self.nexus_collection, repository, "NexusIQ")
+    
+    def _get_latest(self, collection, repository: str, source: str) -> Optional[Dict]:
+        """Get the latest document for a repository, cached for LATEST_CACHE_TTL seconds."""
         try:
-            if self.nexus_collection is None:
-                raise ValueError("NexusIQ collection not initialized")
+            if collection is None:
+                raise ValueError(f"{source} collection not initialized")
+            
+            key = (collection.name, repository)
+            cached = self._latest_cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
             
-            result = self.nexus_collection.find_one(
+            result = collection.find_one(
                 {'repository': repository},
                 sort=[('timestamp', -1)]
             )
+            self._latest_cache[key] = (time.monotonic() + LATEST_CACHE_TTL, result)
             return result
         except Exception as e:
-            self.logger.error(f"Error getting latest NexusIQ data for {repository}: {str(e)}")
+            self.logger.error(f"Error getting latest {source} data for {repository}: {str(e)}")
             return None
     
+    def _invalidate_latest(self, collection, repositories):
+        """Drop cached latest documents for repositories that were just written."""
+        name = getattr(collection, 'name', None)
+        for repository in repositories:
+            self._latest_cache.pop((name, repository), None)
+    
+    def get_latest_data_by_repository(self, collection, projection: Optional[Dict] = None) -> Dict[str, Dict]:
+        """Get the latest document for every repository in a collection.
+        
+        When a projection is given only those fields are returned, and the
+        partial documents are not added to the get_latest_* cache.
+        """
+        try:
+            if collection is None:
+                raise ValueError("Collection not initialized")
+            
+            pipeline = [{'$sort': {'repository': 1, 'timestamp': -1}}]
+            if projection:
+                pipeline.append({'$project': {**projection, 'repository': 1}})
+            pipeline.append({'$group': {'_id': '$repository', 'doc': {'$first': '$$ROOT'}}})
+            latest = {
+                result['_id']: result['doc']
+                for result in collection.aggregate(pipeline, allowDiskUse=True)
+            }
+            if projection:
+                return latest
+            
+            # Seed the per-repository cache so follow-up get_latest_* calls are free
+            expiry = time.monotonic() + LATEST_CACHE_TTL
+            for repository, document in latest.items():
+                self._latest_cache[(collection.name, repository)] = (expiry, document)
+            return latest
+        except Exception as e:
+            self.logger.error(f"Error getting latest data from {getattr(collection, 'name', collection)}: {str(e)}")
+            return {}
+    
     def create_excel_report(self, output_file: str = "repository_report.xlsx") -> Optional[str]:
         """Create an Excel report from the collected data."""
         try:
             if any(collection is None for collection in [self.github_collection, self.sonar_collection, self.nexus_collection]):
                 raise ValueError("One or more collections not initialized")
             
-            # Get all repositories from GitHub collection
-            repositories = list(self.github_collection.distinct('repository'))
+            # Latest document per repository, one aggregation per collection, run
+            # concurrently on the shared client pool. GitHub documents carry large
+            # stats (commit history, branches, releases) that the report never
+            # reads, so only fetch the fields it uses
+            with ThreadPoolExecutor(max_workers=3) as executor:
+                github_future = executor.submit(self.get_latest_data_by_repository, self.github_collection, REPORT_GITHUB_FIELDS)
+                sonar_future = executor.submit(self.get_latest_data_by_repository, self.sonar_collection)
+                nexus_future = executor.submit(self.get_latest_data_by_repository, self.nexus_collection)
+            latest_github = github_future.result()
+            latest_sonar = sonar_future.result()
+            latest_nexus = nexus_future.result()
+            
+            repositories = sorted(latest_github)
             if not repositories:
                 self.logger.warning("No repositories found to create report")
                 return None
@@ -184,16 +344,26 @@ class DataStorage:
             filename = f"repository_analysis_{timestamp}.xlsx"
             
             # Create Excel writer
-            with pd.ExcelWriter(filename, engine='openpyxl') as writer:
+            # constant_memory flushes each row as soon as the next one starts,
+            # so every sheet is written top to bottom through _write_records
+            excel_options = {
+                'constant_memory': True,
+                'strings_to_urls': False,
+                'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+            }
+            with xlsxwriter.Workbook(filename, excel_options) as workbook:
+                header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+                
                 # Create summary sheet
                 summary_data = []
                 for repo in repositories:
-                    github_data = self.get_latest_github_data(repo)
-                    sonar_data = self.get_latest_sonar_data(repo)
-                    nexus_data = self.get_latest_nexus_data(repo)
+                    github_data = latest_github.get(repo)
+                    sonar_data = latest_sonar.get(repo)
+                    nexus_data = latest_nexus.get(repo)
                     
                     if github_data:
-                        pr_metrics = github_data.get('pr_metrics', {})
+                        insights = github_data.get('data', github_data)
+                        pr_metrics = insights.get('pr_metrics', {})
                         summary_data.append({
                             'Repository': repo,
                             'Last Updated': github_data.get('timestamp', 'N/A'),
@@ -206,7 +376,7 @@ class DataStorage:
                             'Avg Time to First Review (hours)': pr_metrics.get('review_time', {}).get('avg_time_to_first_review', 0),
                             'Avg Review Time (hours)': pr_metrics.get('review_time', {}).get('avg_review_time', 0),
                             'Comment Density': pr_metrics.get('comment_density', 0),
-                            'Total Commits': github_data.get('commit_activity', {}).get('total_commits', 0),
+                            'Total Commits': insights.get('commit_activity', {}).get('total_commits', 0),
                             'Code Smells': sonar_data.get('code_smells', 0) if sonar_data else 0,
                             'Bugs': sonar_data.get('bugs', 0) if sonar_data else 0,
                             'Vulnerabilities': sonar_data.get('vulnerabilities', 0) if sonar_data else 0,
@@ -216,25 +386,30 @@ class DataStorage:
                 
                 # Write summary sheet
                 if summary_data:
-                    pd.DataFrame(summary_data).to_excel(writer, sheet_name='Summary', index=False)
+                    self._write_records(workbook, header_format, 'Summary', summary_data)
                 
-                # Create detailed sheets for each repository
+                # One-row-per-repository details share a sheet per section, with
+                # the repository as the first column; empty sections are skipped
+                size_rows, review_rows, commit_rows, sonar_rows, nexus_rows = [], [], [], [], []
+                contributors_by_repo = []
                 for repo in repositories:
-                    github_data = self.get_latest_github_data(repo)
-                    sonar_data = self.get_latest_sonar_data(repo)
-                    nexus_data = self.get_latest_nexus_data(repo)
+                    github_data = latest_github.get(repo)
+                    sonar_data = latest_sonar.get(repo)
+                    nexus_data = latest_nexus.get(repo)
                     
                     if github_data:
-                        # PR Metrics sheet
-                        pr_metrics = github_data.get('pr_metrics', {})
+                        insights = github_data.get('data', github_data)
+                        
+                        # PR Metrics
+                        pr_metrics = insights.get('pr_metrics', {})
                         if pr_metrics:
                             # PR Size Distribution
-                            size_distribution = pd.DataFrame([pr_metrics.get('pr_size_distribution', {})])
-                            size_distribution.to_excel(writer, sheet_name=f'{repo}_PR_Size_Distribution', index=False)
+                            if size_distribution := pr_metrics.get('pr_size_distribution'):
+                                size_rows.append({'Repository': repo, **size_distribution})
                             
                             # Review Times
-                            review_times = pd.DataFrame([pr_metrics.get('review_time', {})])
-                            review_times.to_excel(writer, sheet_name=f'{repo}_Review_Times', index=False)
+                            if review_time := pr_metrics.get('review_time'):
+                                review_rows.append({'Repository': repo, **review_time})
                             
                             # Contributors
                             contributors_data = []
@@ -247,20 +422,37 @@ class DataStorage:
                                     'Total Reviews': stats.get('total_reviews', 0)
                                 })
                             if contributors_data:
-                                pd.DataFrame(contributors_data).to_excel(writer, sheet_name=f'{repo}_Contributors', index=False)
+                                # Keep the suffix intact by shortening the repository part
+                                prefix = INVALID_SHEET_CHARS.sub('_', repo)[:MAX_SHEET_NAME - len(CONTRIBUTORS_SUFFIX)]
+                                contributors_by_repo.append((prefix + CONTRIBUTORS_SUFFIX, contributors_data))
                         
-                        # Commit Activity sheet
-                        commit_activity = github_data.get('commit_activity', {})
+                        # Commit Activity
+                        commit_activity = insights.get('commit_activity', {})
                         if commit_activity:
-                            pd.DataFrame([commit_activity]).to_excel(writer, sheet_name=f'{repo}_Commit_Activity', index=False)
+                            commit_rows.append({'Repository': repo, **commit_activity})
                     
                     if sonar_data:
-                        # SonarQube Analysis sheet
-                        pd.DataFrame([sonar_data]).to_excel(writer, sheet_name=f'{repo}_SonarQube', index=False)
+                        # SonarQube Analysis
+                        sonar_rows.append({'Repository': repo, **{k: v for k, v in sonar_data.items() if k != 'repository'}})
                     
                     if nexus_data:
-                        # NexusIQ Analysis sheet
-                        pd.DataFrame([nexus_data]).to_excel(writer, sheet_name=f'{repo}_NexusIQ', index=False)
+                        # NexusIQ Analysis
+                        nexus_rows.append({'Repository': repo, **{k: v for k, v in nexus_data.items() if k != 'repository'}})
+                
+                detail_sheets = [
+                    ('PR_Size_Distribution', size_rows),
+                    ('Review_Times', review_rows),
+                    ('Commit_Activity', commit_rows),
+                    ('SonarQube', sonar_rows),
+                    ('NexusIQ', nexus_rows)
+                ]
+                for sheet_name, rows in detail_sheets:
+                    if rows:
+                        self._write_records(workbook, header_format, sheet_name, rows)
+                
+                # Contributor lists have many rows each, so they keep a sheet per repository
+                for sheet_name, contributors_data in contributors_by_repo:
+                    self._write_records(workbook, header_format, sheet_name, contributors_data)
             
             self.logger.info(f"Successfully created Excel report: {filename}")
             return filename
@@ -268,11 +460,51 @@ class DataStorage:
             self.logger.error(f"Error creating Excel report: {str(e)}")
             return None
     
+    @staticmethod
+    def _write_records(workbook, header_format, sheet_name: str, records: List[Dict]):
+        """Write a list of records to a new worksheet, one row at a time."""
+        # Excel limits sheet names to 31 characters and they must be unique
+        base_name = sheet_name[:MAX_SHEET_NAME]
+        existing = {ws.get_name().lower() for ws in workbook.worksheets()}
+        sheet_name, suffix = base_name, 1
+        while sheet_name.lower() in existing:
+            tag = f'~{suffix}'
+            sheet_name, suffix = base_name[:MAX_SHEET_NAME - len(tag)] + tag, suffix + 1
+        worksheet = workbook.add_worksheet(sheet_name)
+        
+        # Columns in first-seen order, as a DataFrame built from the records would have
+        columns = list(dict.fromkeys(key for record in records for key in record))
+        if not columns:
+            return
+        
+        worksheet.write_row(0, 0, columns, header_format)
+        # Call the typed writers directly; the generic write() re-sniffs every
+        # string for formulas and URLs
+        for row, record in enumerate(records, start=1):
+            for col, key in enumerate(columns):
+                value = record.get(key)
+                if value is None or (isinstance(value, float) and value != value):
+                    continue
+                if isinstance(value, str):
+                    worksheet.write_string(row, col, value)
+                elif isinstance(value, bool):
+                    worksheet.write_boolean(row, col, value)
+                elif isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+                    worksheet.write_number(row, col, value)
+                elif isinstance(value, datetime):
+                    worksheet.write_datetime(row, col, value)
+                else:
+                    worksheet.write_string(row, col, str(value))
+    
     def close(self):
-        """Close MongoDB connection."""
+        """Release this instance's MongoDB connection.
+        
+        The client is shared with other DataStorage instances for the same URI, so it
+        stays open and is closed at interpreter exit.
+        """
         if self.client:
-            self.client.close()
-            self.logger.info("MongoDB connection closed")
+            self.client = None
+            self.logger.info("MongoDB connection released")
 
 def main():
     """Main function to store repository data in MongoDB."""
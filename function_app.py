@@ -2,6 +2,8 @@ import azure.functions as func
 import logging
 import os
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, UTC
 from dotenv import load_dotenv
 
@@ -24,6 +26,16 @@ HEADERS = {
     'Accept': 'application/vnd.github.v3+json'
 }
 
+# Shared session so warm invocations reuse connections to api.github.com
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=20,
+    pool_maxsize=20,
+    max_retries=Retry(total=5, backoff_factor=0.5,
+                      status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+))
+
 logging.info(f"Configured to monitor organization: {GITHUB_ORG}")
 logging.info(f"Configured repositories: {GITHUB_REPOS}")
 
@@ -38,7 +50,7 @@ def get_pr_timeline(repo, pr_number):
     """Fetch timeline events for a pull request."""
     url = f'https://api.github.com/repos/{GITHUB_ORG}/{repo}/issues/{pr_number}/timeline'
     try:
-        response = requests.get(url, headers=HEADERS)
+        response = SESSION.get(url)
         response.raise_for_status()
         return response.json()
     except requests.exceptions.RequestException as e:
@@ -74,7 +86,7 @@ def get_pull_requests(repo):
         logging.info(f"Fetching pull requests from: {url} (Page {page})")
         
         try:
-            response = requests.get(url, headers=HEADERS, params=params)
+            response = SESSION.get(url, params=params)
             response.raise_for_status()
             prs = response.json()
             
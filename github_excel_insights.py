@@ -1,9 +1,14 @@
 import os
 import logging
+import openpyxl
 import pandas as pd
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dotenv import load_dotenv
-from github_insights import GitHubInsights
+from github_insights import GitHubInsights, GRAPHQL_BATCH_SIZE
+
+# Concurrent repositories fetched from the GitHub API
+MAX_WORKERS = 16
 
 # Configure logging
 logging.basicConfig(
@@ -15,7 +20,7 @@ def process_excel(input_file: str, output_file: str) -> None:
     """Process GitHub insights for repositories listed in Excel file."""
     # Load environment variables
     load_dotenv()
-    token = os.getenv('GITHUB_TOKEN')
+    token = os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN')
     org = os.getenv('GITHUB_ORG')
 
     if not all([token, org]):
@@ -37,67 +42,105 @@ def process_excel(input_file: str, output_file: str) -> None:
             logging.error("Input Excel must contain a 'Repository' column")
             return
 
-        # Initialize new columns for insights
-        df['Last Commit SHA'] = ''
-        df['Last Commit Message'] = ''
-        df['Last Commit Author'] = ''
-        df['Last Commit Date'] = ''
-        df['Top Contributors'] = ''
-        df['Stars'] = 0
-        df['Forks'] = 0
-        df['Watchers'] = 0
-        df['Open Issues'] = 0
-        df['Size (KB)'] = 0
-        df['Primary Language'] = ''
-        df['Processed At'] = ''
-
-        # Process each repository
-        total_repos = len(df)
-        for index, row in df.iterrows():
-            repo = row['Repository']
-            logging.info(f"Processing repository {index + 1}/{total_repos}: {repo}")
-            
+        # Default values for the insight columns
+        defaults = {
+            'Last Commit SHA': '',
+            'Last Commit Message': '',
+            'Last Commit Author': '',
+            'Last Commit Date': '',
+            'Top Contributors': '',
+            'Stars': 0,
+            'Forks': 0,
+            'Watchers': 0,
+            'Open Issues': 0,
+            'Size (KB)': 0,
+            'Primary Language': '',
+            'Processed At': ''
+        }
+
+        # Fetch insights for all repositories concurrently; the calls are
+        # dominated by GitHub API latency
+        repos = df['Repository'].tolist()
+        total_repos = len(repos)
+        
+        # Last commit and stats come from batched GraphQL queries; repositories
+        # missing from a failed batch are looked up one by one in fetch()
+        def fetch_overview(batch):
+            try:
+                return insights_client.get_insights_overview(batch)
+            except Exception as e:
+                logging.warning(f"GraphQL insights batch failed, fetching repositories individually: {str(e)}")
+                return {}
+        
+        def fetch(position, repo):
+            logging.info(f"Processing repository {position + 1}/{total_repos}: {repo}")
             try:
-                # Get insights for the repository
-                insights = insights_client.get_insights(repo)
+                return insights_client.get_insights(repo, overviews.get(repo)), None
+            except Exception as e:
+                return None, e
+        
+        batches = [repos[i:i + GRAPHQL_BATCH_SIZE] for i in range(0, total_repos, GRAPHQL_BATCH_SIZE)]
+        overviews = {}
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for overview in executor.map(fetch_overview, batches):
+                overviews.update(overview)
+            results = list(executor.map(fetch, range(total_repos), repos))
+        
+        # Build one plain dict per repository and add the columns in one go
+        rows = []
+        for repo, (insights, error) in zip(repos, results):
+            row = dict(defaults)
+            try:
+                if error is not None:
+                    raise error
                 
-                # Update DataFrame with insights
                 if insights['last_commit']:
                     commit = insights['last_commit']
-                    df.at[index, 'Last Commit SHA'] = commit['sha'][:7]
-                    df.at[index, 'Last Commit Message'] = commit['message']
-                    df.at[index, 'Last Commit Author'] = commit['author']
-                    df.at[index, 'Last Commit Date'] = commit['date']
+                    row['Last Commit SHA'] = commit['sha'][:7]
+                    row['Last Commit Message'] = commit['message']
+                    row['Last Commit Author'] = commit['author']
+                    row['Last Commit Date'] = commit['date']
 
                 if insights['contributors']:
                     top_contributors = [
                         f"{c['login']} ({c['contributions']})"
                         for c in insights['contributors'][:5]
                     ]
-                    df.at[index, 'Top Contributors'] = ', '.join(top_contributors)
+                    row['Top Contributors'] = ', '.join(top_contributors)
 
                 if insights['stats']:
                     stats = insights['stats']
-                    df.at[index, 'Stars'] = stats['stars']
-                    df.at[index, 'Forks'] = stats['forks']
-                    df.at[index, 'Watchers'] = stats['watchers']
-                    df.at[index, 'Open Issues'] = stats['open_issues']
-                    df.at[index, 'Size (KB)'] = stats['size']
-                    df.at[index, 'Primary Language'] = stats['language']
+                    row['Stars'] = stats['stars']
+                    row['Forks'] = stats['forks']
+                    row['Watchers'] = stats['watchers']
+                    row['Open Issues'] = stats['open_issues']
+                    row['Size (KB)'] = stats['size']
+                    row['Primary Language'] = stats['language']
 
-                df.at[index, 'Processed At'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+                row['Processed At'] = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
 
             except Exception as e:
                 logging.error(f"Error processing repository {repo}: {str(e)}")
-                df.at[index, 'Processed At'] = f"Error: {str(e)}"
+                row['Processed At'] = f"Error: {str(e)}"
+            rows.append(row)
+
+        df[list(defaults)] = pd.DataFrame(rows, columns=list(defaults), index=df.index)
 
         # Save results to new Excel file
         logging.info(f"Saving results to: {output_file}")
-        df.to_excel(output_file, index=False)
+        # Write-only mode streams rows instead of building the whole workbook in memory
+        wb = openpyxl.Workbook(write_only=True)
+        ws = wb.create_sheet('Sheet1')
+        ws.append(list(df.columns))
+        for values in df.itertuples(index=False, name=None):
+            ws.append([None if pd.isna(value) else value for value in values])
+        wb.save(output_file)
         logging.info("Processing completed successfully")
 
     except Exception as e:
         logging.error(f"Error processing Excel file: {str(e)}")
+    finally:
+        insights_client.close()
 
 if __name__ == "__main__":
     # Example usage
@@ -1,45 +1,151 @@
+import itertools
 import logging
+import shelve
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
+from urllib.parse import urlencode
 import time
 
+# Tokens with fewer requests left than this are skipped until their window resets
+TOKEN_MIN_REMAINING = 10
+
+# Repositories looked up per aliased GraphQL query
+GRAPHQL_BATCH_SIZE = 25
+
+# Fields behind the last-commit and stats parts of get_insights
+_REPO_OVERVIEW_FIELDS = """
+    stargazerCount
+    forkCount
+    diskUsage
+    primaryLanguage { name }
+    issues(states: OPEN) { totalCount }
+    pullRequests(states: OPEN) { totalCount }
+    defaultBranchRef {
+      target { ... on Commit { history(first: 1) { nodes { oid message authoredDate author { name } } } } }
+    }
+"""
+
 class GitHubInsights:
-    def __init__(self, token: str, account: str, is_organization: bool = True):
-        """Initialize GitHub Insights with token and account name."""
+    def __init__(self, token: str, account: str, is_organization: bool = True,
+                 session: Optional[requests.Session] = None,
+                 use_cache: bool = True, cache_file: str = '.gh_insights_cache'):
+        """Initialize GitHub Insights with token and account name.
+        
+        token may hold several comma-separated tokens, which are used in turn.
+        A shared requests.Session may be passed in; otherwise one is created with a
+        connection pool large enough for concurrent callers. With use_cache, JSON
+        responses are kept in cache_file and revalidated with ETags on later runs.
+        """
         self.token = token
+        self.tokens = [t.strip() for t in token.split(',') if t.strip()]
+        if not self.tokens:
+            raise ValueError("No GitHub token provided")
+        self._token_cycle = itertools.cycle(self.tokens)
+        # (token, rate limit resource) -> (remaining, reset epoch seconds)
+        self._token_limits: Dict[tuple, tuple] = {}
+        self._token_lock = threading.Lock()
         self.account = account
         self.is_organization = is_organization
         self.base_url = "https://api.github.com"
         self.headers = {
-            "Authorization": f"token {token}",
+            "Authorization": f"token {self.tokens[0]}",
             "Accept": "application/vnd.github.v3+json"
         }
         self.logger = logging.getLogger(__name__)
         self.logger.info(f"Initialized GitHub Insights for {'organization' if is_organization else 'user'} account: {account}")
-        self.rate_limit_remaining = 5000  # Default rate limit
-        self.rate_limit_reset = 0
+        if session is None:
+            session = requests.Session()
+            retries = Retry(total=5, backoff_factor=0.5,
+                            status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+            adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32, max_retries=retries)
+            session.mount('https://', adapter)
+            session.mount('http://', adapter)
+        self.session = session
+        
+        # url -> (validators, body). Unchanged endpoints answer 304, which costs
+        # no rate limit and carries no body, so re-runs are served from here.
+        self._etag_lock = threading.Lock()
+        self._etag_cache = None
+        if use_cache:
+            try:
+                self._etag_cache = shelve.open(cache_file)
+            except Exception as e:
+                self.logger.warning(f"Could not open response cache {cache_file}, continuing without it: {str(e)}")
+
+    def _next_token(self, resource: str) -> str:
+        """Pick the next token that still has requests left, waiting if none does."""
+        with self._token_lock:
+            for _ in range(len(self.tokens)):
+                token = next(self._token_cycle)
+                remaining, reset = self._token_limits.get((token, resource), (None, 0))
+                if remaining is None or remaining > TOKEN_MIN_REMAINING or reset <= time.time():
+                    return token
+            
+            # Every token is low: wait for the earliest window to reset
+            token = min(self.tokens, key=lambda t: self._token_limits[(t, resource)][1])
+            wait_time = self._token_limits[(token, resource)][1] - time.time() + 1
+        
+        # Sleep outside the lock so other threads can still record rate limits
+        # and use the other resource's tokens
+        if wait_time > 0:
+            self.logger.warning(f"Rate limit low. Waiting {wait_time} seconds...")
+            time.sleep(wait_time)
+        return token
+
+    def _request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """Send a request with the next available token and record its rate limit."""
+        resource = 'graphql' if url.endswith('/graphql') else 'core'
+        token = self._next_token(resource)
+        headers = {**self.headers, **(kwargs.pop('headers', None) or {}), 'Authorization': f"token {token}"}
+        response = self.session.request(method, url, headers=headers, **kwargs)
+        
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        if remaining is not None:
+            with self._token_lock:
+                self._token_limits[(token, resource)] = (
+                    int(remaining), int(response.headers.get('X-RateLimit-Reset', 0))
+                )
+        return response
+
+    def _get_cached(self, url: str, params: Dict = None) -> Any:
+        """GET a JSON endpoint, revalidating against the ETag cache when enabled."""
+        key = f'{url}?{urlencode(params)}' if params else url
+        cached = None
+        if self._etag_cache is not None:
+            with self._etag_lock:
+                cached = self._etag_cache.get(key)
+        
+        response = self._request('GET', url, params=params, headers=cached[0] if cached else None)
+        if response.status_code == 304 and cached:
+            return cached[1]
+        response.raise_for_status()
+        data = response.json()
+        
+        validators = {}
+        if 'ETag' in response.headers:
+            validators['If-None-Match'] = response.headers['ETag']
+        if 'Last-Modified' in response.headers:
+            validators['If-Modified-Since'] = response.headers['Last-Modified']
+        if self._etag_cache is not None and response.status_code == 200 and validators:
+            with self._etag_lock:
+                self._etag_cache[key] = (validators, data)
+        return data
+
+    def close(self):
+        """Flush and close the ETag cache."""
+        if self._etag_cache is not None:
+            with self._etag_lock:
+                self._etag_cache.close()
+            self._etag_cache = None
 
     def _make_request(self, url: str, params: Dict = None) -> Optional[Dict]:
         """Make a request to the GitHub API with rate limit handling."""
         try:
-            # Check rate limit
-            if self.rate_limit_remaining <= 10:  # Leave some buffer
-                reset_time = datetime.fromtimestamp(self.rate_limit_reset)
-                now = datetime.now()
-                if now < reset_time:
-                    wait_time = (reset_time - now).total_seconds() + 1
-                    self.logger.warning(f"Rate limit low. Waiting {wait_time} seconds...")
-                    time.sleep(wait_time)
-
-            response = requests.get(url, headers=self.headers, params=params)
-            
-            # Update rate limit info
-            self.rate_limit_remaining = int(response.headers.get('X-RateLimit-Remaining', 5000))
-            self.rate_limit_reset = int(response.headers.get('X-RateLimit-Reset', 0))
-            
-            response.raise_for_status()
-            return response.json()
+            return self._get_cached(url, params)
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -70,9 +176,7 @@ class GitHubInsights:
                 'direction': 'desc'
             }
             
-            response = requests.get(url, headers=self.headers, params=params)
-            response.raise_for_status()
-            return response.json()
+            return self._get_cached(url, params)
             
         except requests.exceptions.HTTPError as e:
             if e.response.status_code == 404:
@@ -95,7 +199,7 @@ class GitHubInsights:
             else:
                 url = f'{self.base_url}/users/{self.account}'
                 
-            response = requests.get(url, headers=self.headers)
+            response = self._request('GET', url)
             
             if response.status_code == 404:
                 account_type = "organization" if self.is_organization else "user"
@@ -142,7 +246,7 @@ class GitHubInsights:
             all_times = []
             
             while True:
-                response = requests.get(url, headers=self.headers, params=params)
+                response = self._request('GET', url, params=params)
                 response.raise_for_status()
                 prs = response.json()
                 
@@ -647,9 +751,7 @@ class GitHubInsights:
         """Get list of contributors for a repository."""
         url = f'{self.base_url}/repos/{self.account}/{repo}/contributors'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            contributors = response.json()
+            contributors = self._get_cached(url)
             logging.info(f"Found {len(contributors)} contributors for {repo}")
             return contributors
         except requests.exceptions.RequestException as e:
@@ -660,9 +762,7 @@ class GitHubInsights:
         """Get the most recent commit for a repository."""
         url = f'{self.base_url}/repos/{self.account}/{repo}/commits'
         try:
-            response = requests.get(url, headers=self.headers, params={'per_page': 1})
-            response.raise_for_status()
-            commits = response.json()
+            commits = self._get_cached(url, {'per_page': 1})
             if commits:
                 return commits[0]
             return None
@@ -674,47 +774,91 @@ class GitHubInsights:
         """Get repository statistics including stars, forks, and watchers."""
         url = f'{self.base_url}/repos/{self.account}/{repo}'
         try:
-            response = requests.get(url, headers=self.headers)
-            response.raise_for_status()
-            return response.json()
+            return self._get_cached(url)
         except requests.exceptions.RequestException as e:
             logging.error(f"Error fetching stats for {repo}: {str(e)}")
             return {}
 
-    def get_insights(self, repo: str) -> Dict:
-        """Get comprehensive insights for a repository."""
-        insights = {
-            'repository': repo,
-            'last_commit': None,
-            'contributors': [],
-            'stats': {}
+    def get_insights_overview(self, repos: List[str]) -> Dict[str, Dict]:
+        """Fetch last commit and stats for several repositories with aliased GraphQL queries.
+        
+        Repositories that do not exist map to empty insights; a failed request raises.
+        """
+        overview = {}
+        for start in range(0, len(repos), GRAPHQL_BATCH_SIZE):
+            batch = repos[start:start + GRAPHQL_BATCH_SIZE]
+            params = ', '.join(f'$n{i}: String!' for i in range(len(batch)))
+            aliases = '\n'.join(
+                f'  r{i}: repository(owner: $owner, name: $n{i}) {{{_REPO_OVERVIEW_FIELDS}  }}'
+                for i in range(len(batch))
+            )
+            query = f'query($owner: String!, {params}) {{\n{aliases}\n}}'
+            variables = {'owner': self.account}
+            variables.update({f'n{i}': str(repo) for i, repo in enumerate(batch)})
+            
+            response = self._request('POST', f'{self.base_url}/graphql',
+                                     json={'query': query, 'variables': variables})
+            response.raise_for_status()
+            payload = response.json()
+            data = payload.get('data')
+            if not data:
+                raise ValueError(payload.get('errors', [{}])[0].get('message', 'GraphQL error'))
+            
+            for i, repo in enumerate(batch):
+                overview[repo] = self._parse_repo_overview(data.get(f'r{i}'))
+        return overview
+
+    @staticmethod
+    def _parse_repo_overview(node: Optional[Dict]) -> Dict:
+        """Convert a GraphQL repository node to the last_commit/stats shape of get_insights."""
+        if not node:
+            return {'last_commit': None, 'stats': {}}
+        
+        history = (((node.get('defaultBranchRef') or {}).get('target') or {}).get('history') or {}).get('nodes') or []
+        last_commit = None
+        if history:
+            commit = history[0]
+            author = commit.get('author') or {}
+            last_commit = {
+                'sha': commit['oid'],
+                'message': commit['message'],
+                'author': author.get('name'),
+                # authoredDate is UTC like the REST commit dates; author.date keeps the local offset
+                'date': commit.get('authoredDate')
+            }
+        
+        return {
+            'last_commit': last_commit,
+            'stats': {
+                'stars': node['stargazerCount'],
+                'forks': node['forkCount'],
+                # REST reports watchers_count as the stargazer count
+                'watchers': node['stargazerCount'],
+                # REST open_issues_count includes open pull requests
+                'open_issues': node['issues']['totalCount'] + node['pullRequests']['totalCount'],
+                'size': node['diskUsage'] or 0,
+                'language': (node.get('primaryLanguage') or {}).get('name')
+            }
         }
 
+    def _get_rest_overview(self, repo: str) -> Dict:
+        """Fetch last commit and stats for one repository over REST."""
+        overview = {'last_commit': None, 'stats': {}}
+        
         # Get last commit
         last_commit = self.get_last_commit(repo)
         if last_commit:
-            insights['last_commit'] = {
+            overview['last_commit'] = {
                 'sha': last_commit['sha'],
                 'message': last_commit['commit']['message'],
                 'author': last_commit['commit']['author']['name'],
                 'date': last_commit['commit']['author']['date']
             }
 
-        # Get contributors
-        contributors = self.get_repo_contributors(repo)
-        insights['contributors'] = [
-            {
-                'login': c['login'],
-                'contributions': c['contributions'],
-                'avatar_url': c['avatar_url']
-            }
-            for c in contributors
-        ]
-
         # Get repository stats
         stats = self.get_repo_stats(repo)
         if stats:
-            insights['stats'] = {
+            overview['stats'] = {
                 'stars': stats.get('stargazers_count', 0),
                 'forks': stats.get('forks_count', 0),
                 'watchers': stats.get('watchers_count', 0),
@@ -722,6 +866,41 @@ class GitHubInsights:
                 'size': stats.get('size', 0),
                 'language': stats.get('language', 'Unknown')
             }
+        
+        return overview
+
+    def get_insights(self, repo: str, overview: Optional[Dict] = None) -> Dict:
+        """Get comprehensive insights for a repository.
+        
+        overview may carry a pre-fetched entry from get_insights_overview. Without it
+        the last commit and stats come from one GraphQL query, falling back to REST.
+        """
+        insights = {
+            'repository': repo,
+            'last_commit': None,
+            'contributors': [],
+            'stats': {}
+        }
+
+        if overview is None:
+            try:
+                overview = self.get_insights_overview([repo])[repo]
+            except Exception as e:
+                logging.warning(f"GraphQL insights query failed for {repo}, falling back to REST: {str(e)}")
+                overview = self._get_rest_overview(repo)
+        insights['last_commit'] = overview['last_commit']
+        insights['stats'] = overview['stats']
+
+        # Contributor commit counts are only exposed over REST
+        contributors = self.get_repo_contributors(repo)
+        insights['contributors'] = [
+            {
+                'login': c['login'],
+                'contributions': c['contributions'],
+                'avatar_url': c['avatar_url']
+            }
+            for c in contributors
+        ]
 
         return insights
 
@@ -769,7 +948,7 @@ if __name__ == "__main__":
 
     # Load environment variables
     load_dotenv()
-    token = os.getenv('GITHUB_TOKEN')
+    token = os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN')
     account = os.getenv('GITHUB_ACCOUNT')
     is_organization = os.getenv('GITHUB_IS_ORGANIZATION', 'True').lower() == 'true'
     repos = os.getenv('GITHUB_REPOS', '').split(',')
@@ -792,4 +971,6 @@ if __name__ == "__main__":
         logging.info(f"\nProcessing repository: {repo}")
         insights = insights_client.get_repository_insights(repo)
         formatted_output = insights_client.format_insights(insights)
-        print(formatted_output) 
\ No newline at end of file
+        print(formatted_output)
+    
+    insights_client.close()
@@ -2,7 +2,6 @@ import os
 import logging
 from typing import Dict, List, Optional, Tuple, Any
 from concurrent.futures import ThreadPoolExecutor, as_completed
-import json
 from datetime import datetime, timezone, timedelta
 import requests
 import schedule
@@ -11,7 +10,6 @@ from github_insights import GitHubInsights
 from sonarqube_analyzer import SonarQubeAnalyzer
 from nexus_iq_analyzer import NexusIQAnalyzer
 from data_storage import DataStorage
-from pymongo import MongoClient
 from dotenv import load_dotenv
 import pandas as pd
 
@@ -25,12 +23,8 @@ logger = logging.getLogger(__name__)
 # Load environment variables
 load_dotenv()
 
-class DateTimeEncoder(json.JSONEncoder):
-    """Custom JSON encoder for datetime objects."""
-    def default(self, obj):
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+# Number of scanned repositories buffered before their results are written
+STORE_BATCH_SIZE = 50
 
 class OrgRepoScanner:
     def __init__(self, github_token: str, github_org: str, is_organization: bool, sonar_url: str, sonar_token: str, 
@@ -50,6 +44,11 @@ class OrgRepoScanner:
         # Initialize Data Storage
         self.data_storage = DataStorage(mongo_uri)
         
+        # Scan results waiting to be written with one bulk insert per collection
+        self._pending = {'github': [], 'sonar': [], 'nexus': []}
+        # Results per collection still buffered after the last flush failed to store them
+        self._retained = {'github': 0, 'sonar': 0, 'nexus': 0}
+        
         self.logger.info("Repository scanner initialized successfully")
 
     def _scan_repository(self, repo_name: str) -> Dict:
@@ -92,7 +91,7 @@ class OrgRepoScanner:
                 github_insights = self.github_insights.get_repository_insights(repo_name)
                 if github_insights:
                     github_data.update(github_insights)
-                    self.data_storage.store_github_data(repo_name, github_insights)
+                    self._pending['github'].append((repo_name, github_insights))
             except Exception as e:
                 self.logger.error(f"Error fetching GitHub insights: {str(e)}")
             
@@ -101,7 +100,7 @@ class OrgRepoScanner:
                 sonar_insights = self.sonar_analyzer.analyze_repository(repo_name)
                 if sonar_insights:
                     sonar_data.update(sonar_insights)
-                    self.data_storage.store_sonar_data(sonar_data)
+                    self._pending['sonar'].append(dict(sonar_data))
             except Exception as e:
                 self.logger.error(f"Error fetching SonarQube insights: {str(e)}")
             
@@ -110,7 +109,7 @@ class OrgRepoScanner:
                 nexus_insights = self.nexus_analyzer.analyze_repository(repo_name)
                 if nexus_insights:
                     nexus_data.update(nexus_insights)
-                    self.data_storage.store_nexus_data(nexus_data)
+                    self._pending['nexus'].append(dict(nexus_data))
             except Exception as e:
                 self.logger.error(f"Error fetching NexusIQ insights: {str(e)}")
             
@@ -128,6 +127,28 @@ class OrgRepoScanner:
                 'nexus': {}
             }
 
+    def _flush_pending(self):
+        """Write buffered scan results with one bulk insert per collection.
+        
+        Batches that fail to store stay buffered and are retried on the next flush.
+        """
+        stores = {
+            'github': self.data_storage.store_github_data_bulk,
+            'sonar': self.data_storage.store_sonar_data_bulk,
+            'nexus': self.data_storage.store_nexus_data_bulk
+        }
+        for source, store in stores.items():
+            if self._pending[source] and store(self._pending[source]):
+                self._pending[source] = []
+            self._retained[source] = len(self._pending[source])
+
+    def _should_flush(self) -> bool:
+        """Check whether any collection has buffered a full batch since the last flush."""
+        return any(
+            len(items) - self._retained[source] >= STORE_BATCH_SIZE
+            for source, items in self._pending.items()
+        )
+
     def scan_organization(self) -> List[Dict]:
         """Scan all repositories in the organization."""
         try:
@@ -140,14 +161,23 @@ class OrgRepoScanner:
                 return []
             
             results = []
-            for repo in repositories:
-                repo_name = repo.get('name')
-                if not repo_name:
-                    continue
-                
-                result = self._scan_repository(repo_name)
-                if result:
-                    results.append(result)
+            try:
+                for repo in repositories:
+                    repo_name = repo.get('name')
+                    if not repo_name:
+                        continue
+                    
+                    result = self._scan_repository(repo_name)
+                    if result:
+                        results.append(result)
+                    
+                    if self._should_flush():
+                        self._flush_pending()
+            finally:
+                self._flush_pending()
+                for source, items in self._pending.items():
+                    if items:
+                        self.logger.error(f"Could not store {len(items)} {source} results after retrying")
             
             self.logger.info(f"Organization scan completed. Processed {len(results)} repositories")
             return results
@@ -178,7 +208,7 @@ def main():
     load_dotenv()  # Ensure .env file is loaded
     
     # Get environment variables
-    github_token = os.getenv('GITHUB_TOKEN')
+    github_token = os.getenv('GITHUB_TOKENS') or os.getenv('GITHUB_TOKEN')
     github_account = os.getenv('GITHUB_ACCOUNT')
     is_organization = os.getenv('GITHUB_IS_ORGANIZATION', 'True').lower() == 'true'
     sonar_url = os.getenv('SONAR_URL')
@@ -247,6 +277,8 @@ def main():
             logger.info("No repositories found to generate report")
     except Exception as e:
         logging.error(f"Error running repository scanner: {str(e)}")
+    finally:
+        scanner.github_insights.close()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
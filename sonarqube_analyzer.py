@@ -6,7 +6,8 @@ from datetime import datetime
 from typing import Dict, List, Any, Optional
 from dotenv import load_dotenv
 import openpyxl
-from openpyxl.styles import Font, PatternFill, Alignment
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
 from openpyxl.utils import get_column_letter
 
 # Configure logging
@@ -172,8 +173,12 @@ class SonarQubeAnalyzer:
     def update_excel_with_sonarqube_data(self, excel_file: str):
         """Update Excel file with SonarQube analysis data."""
         try:
-            # Read the Excel file directly
-            df = pd.read_excel(excel_file, engine='openpyxl')
+            # Read the Excel file directly; calamine parses the sheet natively and
+            # openpyxl remains the fallback when python-calamine is unavailable
+            try:
+                df = pd.read_excel(excel_file, engine='calamine')
+            except (ImportError, ValueError):
+                df = pd.read_excel(excel_file, engine='openpyxl')
             
             if 'Repository' not in df.columns:
                 raise ValueError("Could not find 'Repository' column in the Excel file")
@@ -199,13 +204,11 @@ class SonarQubeAnalyzer:
                 'Last Analysis'
             ]
             
-            # Initialize new columns with 'N/A'
-            for col in sonar_columns:
-                df[col] = 'N/A'
-            
-            # Process each repository
-            for idx, row in df.iterrows():
-                repo = row['Repository']
+            # Collect one row of SonarQube values per repository, then assign the
+            # columns in one step instead of setting each cell with df.at
+            sonar_rows = []
+            for repo in df['Repository']:
+                sonar_row = dict.fromkeys(sonar_columns, 'N/A')
                 if pd.notna(repo):  # Check if repository name is not NaN
                     project_key = f"{repo}".lower()
                     camel_case_key = self.to_camel_case(project_key)
@@ -214,52 +217,64 @@ class SonarQubeAnalyzer:
                     if project_info := self.get_project_info(project_key):
                         metrics = self.get_project_metrics(project_key)
                         
-                        # Update DataFrame with metrics
-                        df.at[idx, 'SonarQube Status'] = 'Active'
-                        df.at[idx, 'Quality Gate'] = metrics['quality_gate_status']
-                        df.at[idx, 'Bugs'] = metrics['bugs']
-                        df.at[idx, 'Vulnerabilities'] = metrics['vulnerabilities']
-                        df.at[idx, 'Code Smells'] = metrics['code_smells']
-                        df.at[idx, 'Coverage (%)'] = f"{metrics['coverage']:.1f}"
-                        df.at[idx, 'Duplication (%)'] = f"{metrics['duplicated_lines_density']:.1f}"
-                        df.at[idx, 'Security Rating'] = metrics['security_rating']
-                        df.at[idx, 'Reliability Rating'] = metrics['reliability_rating']
-                        df.at[idx, 'Maintainability Rating'] = metrics['sqale_rating']
-                        df.at[idx, 'Lines of Code'] = metrics['lines_of_code']
-                        df.at[idx, 'Cognitive Complexity'] = metrics['cognitive_complexity']
-                        df.at[idx, 'Technical Debt'] = metrics['technical_debt']
-                        df.at[idx, 'Test Success (%)'] = f"{metrics['test_success_density']:.1f}"
-                        df.at[idx, 'Test Failures'] = metrics['test_failures']
-                        df.at[idx, 'Test Errors'] = metrics['test_errors']
-                        df.at[idx, 'Last Analysis'] = metrics['last_analysis']
+                        sonar_row.update({
+                            'SonarQube Status': 'Active',
+                            'Quality Gate': metrics['quality_gate_status'],
+                            'Bugs': metrics['bugs'],
+                            'Vulnerabilities': metrics['vulnerabilities'],
+                            'Code Smells': metrics['code_smells'],
+                            'Coverage (%)': f"{metrics['coverage']:.1f}",
+                            'Duplication (%)': f"{metrics['duplicated_lines_density']:.1f}",
+                            'Security Rating': metrics['security_rating'],
+                            'Reliability Rating': metrics['reliability_rating'],
+                            'Maintainability Rating': metrics['sqale_rating'],
+                            'Lines of Code': metrics['lines_of_code'],
+                            'Cognitive Complexity': metrics['cognitive_complexity'],
+                            'Technical Debt': metrics['technical_debt'],
+                            'Test Success (%)': f"{metrics['test_success_density']:.1f}",
+                            'Test Failures': metrics['test_failures'],
+                            'Test Errors': metrics['test_errors'],
+                            'Last Analysis': metrics['last_analysis']
+                        })
                     else:
-                        df.at[idx, 'SonarQube Status'] = 'Not Found'
+                        sonar_row['SonarQube Status'] = 'Not Found'
+                sonar_rows.append(sonar_row)
+            
+            df[sonar_columns] = pd.DataFrame(sonar_rows, columns=sonar_columns, index=df.index, dtype=object)
             
             # Save directly to a new file first
             output_file = f"{os.path.splitext(excel_file)[0]}_new.xlsx"
             
-            # Save with pandas first
-            df.to_excel(output_file, index=False, engine='openpyxl')
+            # Stream the sheet through a write-only workbook, styling cells as
+            # they are written instead of saving, reloading and saving again
+            wb = openpyxl.Workbook(write_only=True)
+            thin = Side(style='thin')
+            centered = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            wb.add_named_style(NamedStyle(
+                name='sonar_header',
+                font=Font(bold=True),
+                fill=PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid'),
+                border=Border(left=thin, right=thin, top=thin, bottom=thin),
+                alignment=centered
+            ))
+            wb.add_named_style(NamedStyle(name='sonar_body', alignment=centered))
+            ws = wb.create_sheet('Sheet1')
             
-            # Now apply formatting
-            wb = openpyxl.load_workbook(output_file)
-            ws = wb.active
-            
-            # Format headers
-            for col_num, header in enumerate(df.columns, 1):
-                cell = ws.cell(row=1, column=col_num)
-                cell.font = Font(bold=True)
-                cell.fill = PatternFill(start_color='CCE5FF', end_color='CCE5FF', fill_type='solid')
-                cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            for col_num in range(1, len(df.columns) + 1):
                 ws.column_dimensions[get_column_letter(col_num)].width = 15
             
-            # Format data cells
-            for row in range(2, len(df) + 2):
-                for col in range(1, len(df.columns) + 1):
-                    cell = ws.cell(row=row, column=col)
-                    cell.alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+            def styled_row(values, style):
+                cells = []
+                for value in values:
+                    cell = WriteOnlyCell(ws, value=None if pd.isna(value) else value)
+                    cell.style = style
+                    cells.append(cell)
+                return cells
+            
+            ws.append(styled_row(df.columns, 'sonar_header'))
+            for values in df.itertuples(index=False, name=None):
+                ws.append(styled_row(values, 'sonar_body'))
             
-            # Save the formatted workbook
             wb.save(output_file)
             wb.close()
             